@@ -1,10 +1,149 @@
 """Day 10: Factory - Advent of Code 2025."""
 
+import math
+import os
 import re
-from itertools import product
+import shelve
+import signal
+import threading
+import time
+from collections.abc import Iterable, MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from fractions import Fraction
+from functools import lru_cache
+from itertools import repeat
 
 from solutions.utils import get_input
 
+# Matches one diagram [.##.], button (0,2) or joltage block {3,5} per token
+_TOKEN = re.compile(r"\[([.#]+)\]|\(([0-9,]+)\)|\{([0-9,]+)\}")
+
+# Translation table mapping a diagram to binary digits
+_DIAGRAM_BITS = str.maketrans(".#", "01")
+
+
+def mask_indices(mask: int) -> list[int]:
+    """List the counters set in a button mask, lowest first."""
+    return [i for i in range(mask.bit_length()) if mask >> i & 1]
+
+
+class Machine:
+    """A machine parsed once and shared by both parts.
+
+    Lights and buttons are bitmasks with bit i for light/counter i, in the
+    order they appear in the line. A block missing from the line is None.
+    """
+
+    __slots__ = ("buttons", "joltage", "lights", "width")
+
+    def __init__(
+        self,
+        lights: int | None,
+        width: int,
+        buttons: tuple[int, ...],
+        joltage: tuple[int, ...] | None,
+    ) -> None:
+        """Initialize a machine.
+
+        Args:
+            lights: Target light pattern as a bitmask (None without a diagram)
+            width: Number of lights in the diagram
+            buttons: Counters each button affects, as bitmasks
+            joltage: Joltage requirement of each counter (None without a
+                joltage block)
+        """
+        self.lights = lights
+        self.width = width
+        self.buttons = buttons
+        self.joltage = joltage
+
+    @classmethod
+    def parse(cls, line: str) -> "Machine":
+        """Parse a machine specification in a single scan of the line.
+
+        Args:
+            line: A line from the puzzle input
+
+        Returns:
+            The parsed machine
+        """
+        diagram = None
+        joltage = None
+        buttons = []
+        for match in _TOKEN.finditer(line):
+            kind = match.lastindex
+            if kind == 2:
+                mask = 0
+                for x in match[2].split(","):
+                    mask |= 1 << int(x)
+                buttons.append(mask)
+            elif kind == 1:
+                diagram = match[1]
+            else:
+                joltage = match[3]
+
+        lights = None if diagram is None else int(diagram[::-1].translate(_DIAGRAM_BITS), 2)
+        return cls(
+            lights,
+            0 if diagram is None else len(diagram),
+            tuple(buttons),
+            None if joltage is None else tuple(map(int, joltage.split(","))),
+        )
+
+    def target(self) -> list[bool]:
+        """Return the target light pattern as a list of bools.
+
+        Raises:
+            ValueError: If the machine has no diagram
+        """
+        if self.lights is None:
+            raise ValueError("Machine has no diagram")
+        lights = self.lights
+        return [bool(lights >> i & 1) for i in range(self.width)]
+
+    def requirements(self) -> list[int]:
+        """Return the joltage requirements as a list of ints.
+
+        Raises:
+            ValueError: If the machine has no joltage block
+        """
+        if self.joltage is None:
+            raise ValueError("Machine has no joltage requirements")
+        return list(self.joltage)
+
+    def button_indices(self) -> list[list[int]]:
+        """Return the counters each button affects, as index lists."""
+        return [mask_indices(mask) for mask in self.buttons]
+
+    def signature(self, part: int) -> "Signature":
+        """Return the memo signature of this machine for a puzzle part.
+
+        Args:
+            part: Puzzle part (1 or 2)
+
+        Returns:
+            The machine signature
+
+        Raises:
+            ValueError: If the machine lacks the block that part needs
+        """
+        target = self.target() if part == 1 else self.requirements()
+        return part, tuple(map(int, target)), tuple(sorted(self.buttons))
+
+
+@lru_cache(maxsize=1)
+def parse_machines(data: str) -> tuple[Machine, ...]:
+    """Parse all machines from input, once for both parts.
+
+    Args:
+        data: The puzzle input
+
+    Returns:
+        Tuple of parsed machines
+    """
+    return tuple(Machine.parse(line) for line in data.strip().split("\n"))
+
 
 def parse_machine(line: str) -> tuple[list[bool], list[list[int]]]:
     """Parse a machine specification for part 1.
@@ -15,20 +154,10 @@ def parse_machine(line: str) -> tuple[list[bool], list[list[int]]]:
     Returns:
         Tuple of (target pattern as list of bools, list of button toggles)
     """
-    # Extract indicator light diagram [.##.]
-    diagram_match = re.search(r"\[([.#]+)\]", line)
-    if not diagram_match:
+    machine = Machine.parse(line)
+    if machine.lights is None:
         raise ValueError(f"No diagram found in line: {line}")
-    diagram = diagram_match.group(1)
-    target = [c == "#" for c in diagram]
-
-    # Extract button wiring schematics (0,2,3) etc
-    buttons = []
-    for match in re.finditer(r"\(([0-9,]+)\)", line):
-        indices = [int(x) for x in match.group(1).split(",")]
-        buttons.append(indices)
-
-    return target, buttons
+    return machine.target(), machine.button_indices()
 
 
 def parse_machine_part2(line: str) -> tuple[list[int], list[list[int]]]:
@@ -40,19 +169,10 @@ def parse_machine_part2(line: str) -> tuple[list[int], list[list[int]]]:
     Returns:
         Tuple of (joltage requirements as list of ints, list of button indices)
     """
-    # Extract joltage requirements {3,5,4,7}
-    joltage_match = re.search(r"\{([0-9,]+)\}", line)
-    if not joltage_match:
+    machine = Machine.parse(line)
+    if machine.joltage is None:
         raise ValueError(f"No joltage requirements found in line: {line}")
-    joltage = [int(x) for x in joltage_match.group(1).split(",")]
-
-    # Extract button wiring schematics (0,2,3) etc
-    buttons = []
-    for match in re.finditer(r"\(([0-9,]+)\)", line):
-        indices = [int(x) for x in match.group(1).split(",")]
-        buttons.append(indices)
-
-    return joltage, buttons
+    return machine.requirements(), machine.button_indices()
 
 
 def parse_input(data: str) -> list[tuple[list[bool], list[list[int]]]]:
@@ -64,18 +184,64 @@ def parse_input(data: str) -> list[tuple[list[bool], list[list[int]]]]:
     Returns:
         List of (target, buttons) for each machine
     """
-    machines = []
-    for line in data.strip().split("\n"):
-        machines.append(parse_machine(line))
-    return machines
+    return [(machine.target(), machine.button_indices()) for machine in parse_machines(data)]
+
+
+# Up to this many buttons, enumerate every combination in Gray-code order;
+# above it, split the search in half and meet in the middle
+GRAY_CODE_MAX_BUTTONS = 16
+
+
+def to_masks(target: list[bool], buttons: list[list[int]]) -> tuple[int, list[int]]:
+    """Convert a target pattern and button toggles to bitmasks.
+
+    Args:
+        target: Target light pattern
+        buttons: List of button toggle indices
+
+    Returns:
+        Tuple of (target bitmask, list of button bitmasks)
+    """
+    n_lights = len(target)
+    target_mask = sum(1 << i for i, on in enumerate(target) if on)
+    button_masks = [sum(1 << idx for idx in set(btn) if idx < n_lights) for btn in buttons]
+    return target_mask, button_masks
+
+
+def gray_code_presses(button_masks: list[int]) -> dict[int, int]:
+    """Find the fewest presses reaching every reachable light state.
+
+    Combinations are visited in Gray-code order, so each step flips exactly
+    one button and costs a single XOR.
+
+    Args:
+        button_masks: Button bitmasks
+
+    Returns:
+        Mapping from light state to minimum number of presses
+    """
+    best = {0: 0}
+    state = 0
+    presses = 0
+    pressed = 0
+    for step in range(1, 1 << len(button_masks)):
+        # The button to flip is the lowest set bit of the step number
+        button = (step & -step).bit_length() - 1
+        state ^= button_masks[button]
+        pressed ^= 1 << button
+        presses += 1 if pressed >> button & 1 else -1
+        if presses < best.get(state, presses + 1):
+            best[state] = presses
+    return best
 
 
 def solve_machine(target: list[bool], buttons: list[list[int]]) -> int:
     """Find minimum button presses to achieve target configuration.
 
     Since each button toggles (XOR), pressing twice cancels out.
-    So each button is pressed 0 or 1 times.
-    We try all 2^n combinations and find the one that works with fewest presses.
+    So each button is pressed 0 or 1 times. Small machines walk all 2^n
+    combinations in Gray-code order; larger ones meet in the middle, pairing
+    the states reachable from each half of the buttons in O(2^(n/2)).
 
     Args:
         target: Target light pattern
@@ -84,40 +250,86 @@ def solve_machine(target: list[bool], buttons: list[list[int]]) -> int:
     Returns:
         Minimum number of button presses needed
     """
-    n_lights = len(target)
-    n_buttons = len(buttons)
+    target_mask, button_masks = to_masks(target, buttons)
+
+    if len(button_masks) <= GRAY_CODE_MAX_BUTTONS:
+        return gray_code_presses(button_masks).get(target_mask, -1)
+
+    half = len(button_masks) // 2
+    left = gray_code_presses(button_masks[:half])
+    right = gray_code_presses(button_masks[half:])
+    if len(left) > len(right):
+        left, right = right, left
+
+    min_presses = -1
+    for state, presses in left.items():
+        other = right.get(state ^ target_mask)
+        if other is not None and (min_presses == -1 or presses + other < min_presses):
+            min_presses = presses + other
+    return min_presses
+
+
+def solve_machine_gf2(target: list[bool], buttons: list[list[int]]) -> int:
+    """Find minimum button presses by linear algebra over GF(2).
+
+    Each light gives one equation over the buttons that toggle it. Gaussian
+    elimination on bitmask rows yields one particular solution plus a basis of
+    the null space, and only the 2^nullity combinations of that basis are
+    enumerated (in Gray-code order) to minimise the popcount.
+
+    Args:
+        target: Target light pattern
+        buttons: List of button toggle indices
+
+    Returns:
+        Minimum number of button presses needed
+    """
+    target_mask, button_masks = to_masks(target, buttons)
+    n_buttons = len(button_masks)
 
-    # Convert buttons to bitmasks for efficiency
-    button_masks = []
-    for btn in buttons:
-        mask = 0
-        for idx in btn:
-            if idx < n_lights:
-                mask |= 1 << idx
-        button_masks.append(mask)
+    # Row i: which buttons toggle light i, and whether light i must end on
+    rows = [
+        (sum(1 << j for j, mask in enumerate(button_masks) if mask >> i & 1), target_mask >> i & 1)
+        for i in range(len(target))
+    ]
 
-    # Convert target to bitmask
-    target_mask = 0
-    for i, on in enumerate(target):
-        if on:
-            target_mask |= 1 << i
+    pivot_cols = []
+    rank = 0
+    for col in range(n_buttons):
+        bit = 1 << col
+        pivot = next((r for r in range(rank, len(rows)) if rows[r][0] & bit), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        pivot_mask, pivot_rhs = rows[rank]
+        for r in range(len(rows)):
+            if r != rank and rows[r][0] & bit:
+                rows[r] = (rows[r][0] ^ pivot_mask, rows[r][1] ^ pivot_rhs)
+        pivot_cols.append(col)
+        rank += 1
 
-    # Try all combinations of button presses
-    min_presses = float("inf")
+    if any(rhs for _, rhs in rows[rank:]):
+        return -1
 
-    for combo in product([0, 1], repeat=n_buttons):
-        # Calculate resulting light state
-        state = 0
-        presses = 0
-        for i, pressed in enumerate(combo):
-            if pressed:
-                state ^= button_masks[i]
-                presses += 1
+    # Free buttons unpressed; each pivot button is fixed by its row
+    solution = sum(rhs << col for col, (_, rhs) in zip(pivot_cols, rows, strict=False))
 
-        if state == target_mask and presses < min_presses:
-            min_presses = presses
+    # Null space: flip one free button and the pivots that depend on it
+    pivots = set(pivot_cols)
+    kernel = []
+    for free in range(n_buttons):
+        if free not in pivots:
+            vector = 1 << free
+            for col, (mask, _) in zip(pivot_cols, rows, strict=False):
+                if mask >> free & 1:
+                    vector |= 1 << col
+            kernel.append(vector)
 
-    return int(min_presses) if min_presses != float("inf") else -1
+    min_presses = solution.bit_count()
+    for step in range(1, 1 << len(kernel)):
+        solution ^= kernel[(step & -step).bit_length() - 1]
+        min_presses = min(min_presses, solution.bit_count())
+    return min_presses
 
 
 def part1(data: str) -> int:
@@ -131,23 +343,72 @@ def part1(data: str) -> int:
     Returns:
         Total minimum button presses
     """
-    machines = parse_input(data)
     total = 0
 
-    for target, buttons in machines:
-        presses = solve_machine(target, buttons)
+    for machine in parse_machines(data):
+        presses = solve_signature(machine.signature(1))
         total += presses
 
     return total
 
 
+def eliminate(
+    target: list[int], buttons: list[list[int]]
+) -> tuple[list[list[int]], list[int]] | None:
+    """Reduce the joltage system to integer row echelon form without fractions.
+
+    Rows are combined by cross-multiplication and divided by their gcd, so
+    every entry stays an integer and small. Each pivot row then reads
+    pivot * x[pivot_col] + sum(coef * x[free_col]) = rhs with a positive pivot.
+
+    Args:
+        target: Target joltage values for each counter
+        buttons: List of button indices (which counters each button affects)
+
+    Returns:
+        Tuple of (pivot rows as coefficients plus rhs, pivot columns), or None
+        if the system is inconsistent
+    """
+    n_buttons = len(buttons)
+    matrix = [
+        [1 if i in button else 0 for button in buttons] + [value] for i, value in enumerate(target)
+    ]
+
+    pivot_cols: list[int] = []
+    for col in range(n_buttons):
+        rank = len(pivot_cols)
+        pivot_found = next((r for r in range(rank, len(matrix)) if matrix[r][col]), None)
+        if pivot_found is None:
+            continue
+        matrix[rank], matrix[pivot_found] = matrix[pivot_found], matrix[rank]
+        if matrix[rank][col] < 0:
+            matrix[rank] = [-v for v in matrix[rank]]
+        pivot_row = matrix[rank]
+        pivot = pivot_row[col]
+
+        for r, row in enumerate(matrix):
+            factor = row[col]
+            if r != rank and factor:
+                combined = [pivot * a - factor * b for a, b in zip(row, pivot_row, strict=True)]
+                divisor = math.gcd(*combined)
+                matrix[r] = [v // divisor for v in combined] if divisor > 1 else combined
+
+        pivot_cols.append(col)
+
+    rank = len(pivot_cols)
+    if any(row[n_buttons] for row in matrix[rank:]):
+        return None
+    return matrix[:rank], pivot_cols
+
+
 def solve_machine_part2(target: list[int], buttons: list[list[int]]) -> int:
     """Find minimum button presses to achieve target joltage configuration.
 
     This is an ILP problem: minimize sum(x) subject to Ax = b, x >= 0, x integer
     where A is the button-counter incidence matrix and b is the target.
 
-    Uses Gaussian elimination to reduce the problem, then searches the reduced space.
+    Uses fraction-free elimination to reduce the problem, then searches the
+    reduced space with integer arithmetic only.
 
     Args:
         target: Target joltage values for each counter
@@ -156,205 +417,433 @@ def solve_machine_part2(target: list[int], buttons: list[list[int]]) -> int:
     Returns:
         Minimum number of button presses needed
     """
-    from fractions import Fraction
-
-    n_counters = len(target)
     n_buttons = len(buttons)
 
     if n_buttons == 0:
         return 0 if all(t == 0 for t in target) else -1
 
-    # Build the augmented matrix [A | b] where A^T x = b
-    matrix: list[list[Fraction]] = []
-    for i in range(n_counters):
-        matrix_row: list[Fraction] = []
-        for j in range(n_buttons):
-            if i in buttons[j]:
-                matrix_row.append(Fraction(1))
-            else:
-                matrix_row.append(Fraction(0))
-        matrix_row.append(Fraction(target[i]))
-        matrix.append(matrix_row)
+    reduced = eliminate(target, buttons)
+    if reduced is None:
+        return -1
+    rows, pivot_cols = reduced
 
-    # Gaussian elimination to reduced row echelon form
-    pivot_row = 0
-    pivot_cols = []
+    free_cols = [c for c in range(n_buttons) if c not in pivot_cols]
+    pivots = [row[col] for row, col in zip(rows, pivot_cols, strict=True)]
+    rhs = [row[n_buttons] for row in rows]
 
-    for col in range(n_buttons):
-        pivot_found = None
-        for row in range(pivot_row, n_counters):
-            if matrix[row][col] != 0:
-                pivot_found = row
+    # If no free variables, unique solution
+    if not free_cols:
+        if any(b < 0 or b % p for b, p in zip(rhs, pivots, strict=True)):
+            return -1
+        return sum(b // p for b, p in zip(rhs, pivots, strict=True))
+
+    # x[pivot_col] = (rhs[row] - sum(coef[row][free] * x[free])) / pivot[row]
+    # Scaling the objective by the common denominator keeps it integral:
+    # denom * total = obj_constant + sum(obj_coefs[i] * free[i])
+    denom = math.lcm(*pivots)
+    scales = [denom // p for p in pivots]
+    obj_constant = sum(s * b for s, b in zip(scales, rhs, strict=True))
+    # Coefficients of each free variable per row, as tuples for the inner loop
+    columns = [tuple(row[free_col] for row in rows) for free_col in free_cols]
+    obj_coefs = [
+        denom - sum(s * a for s, a in zip(scales, column, strict=True)) for column in columns
+    ]
+
+    # Rows where free variable idx is the last free variable with a nonzero
+    # coefficient; only those give it a valid bound once earlier ones are set
+    last_rows: list[list[tuple[int, int]]] = [[] for _ in free_cols]
+    for r in range(len(rows)):
+        for idx in reversed(range(len(free_cols))):
+            if columns[idx][r]:
+                last_rows[idx].append((r, columns[idx][r]))
                 break
+    negative_after = [any(c < 0 for c in obj_coefs[idx + 1 :]) for idx in range(len(free_cols))]
 
-        if pivot_found is None:
-            continue
+    # Search over free variable space
+    max_target = max(target)
+    best = -1
 
-        matrix[pivot_row], matrix[pivot_found] = matrix[pivot_found], matrix[pivot_row]
+    def compute_bounds(idx: int, residual: list[int]) -> tuple[int, int]:
+        """Compute bounds for free variable idx given the residual right-hand sides."""
+        # Start with wide bounds - any free var value up to 2x max target should suffice
+        lo, hi = 0, max_target * 3
+        for r, coef in last_rows[idx]:
+            effective_rhs = residual[r]
+            if coef > 0:
+                # effective_rhs - coef * free >= 0 => free <= effective_rhs / coef
+                if effective_rhs < 0:
+                    return 1, 0
+                hi = min(hi, effective_rhs // coef)
+            elif effective_rhs < 0:
+                # effective_rhs - coef * free >= 0 => free >= effective_rhs / coef
+                lo = max(lo, -(-effective_rhs // coef))
+        return lo, max(lo, hi)
+
+    def search(idx: int, residual: list[int], partial_obj: int) -> None:
+        nonlocal best
 
-        scale = matrix[pivot_row][col]
-        for c in range(n_buttons + 1):
-            matrix[pivot_row][c] /= scale
+        if idx == len(free_cols):
+            if all(b >= 0 and b % p == 0 for b, p in zip(residual, pivots, strict=True)):
+                total = partial_obj // denom
+                if best == -1 or total < best:
+                    best = total
+            return
 
-        for row in range(n_counters):
-            if row != pivot_row and matrix[row][col] != 0:
-                factor = matrix[row][col]
-                for c in range(n_buttons + 1):
-                    matrix[row][c] -= factor * matrix[pivot_row][c]
+        lo, hi = compute_bounds(idx, residual)
+        if lo > hi:
+            return  # No feasible values
 
-        pivot_cols.append(col)
-        pivot_row += 1
+        coef = obj_coefs[idx]
+        column = columns[idx]
 
-    # Check for inconsistency
-    for row in range(pivot_row, n_counters):
-        if matrix[row][n_buttons] != 0:
-            return -1
+        def descend(val: int) -> None:
+            next_residual = [b - a * val for b, a in zip(residual, column, strict=True)]
+            search(idx + 1, next_residual, partial_obj + coef * val)
 
-    free_cols = [c for c in range(n_buttons) if c not in pivot_cols]
+        if coef >= 0 and not negative_after[idx]:
+            # Can prune: as val increases, objective increases, and no future var can decrease it
+            for val in range(lo, hi + 1):
+                if best != -1 and partial_obj + coef * val >= best * denom:
+                    break
+                descend(val)
+        elif coef >= 0:
+            # Can't prune: future variables might decrease objective
+            for val in range(lo, hi + 1):
+                descend(val)
+        else:
+            # Prefer larger values - as val increases, objective decreases
+            for val in range(hi, lo - 1, -1):
+                descend(val)
 
-    # If no free variables, unique solution
-    if not free_cols:
-        solution = [Fraction(0)] * n_buttons
-        for row, col in enumerate(pivot_cols):
-            solution[col] = matrix[row][n_buttons]
+    search(0, rhs, obj_constant)
 
-        for s in solution:
-            if s < 0 or s.denominator != 1:
-                return -1
-        return sum(int(s) for s in solution)
+    return best
 
-    # With free variables, express objective and constraints
-    # x[pivot_col] = rhs[row] - sum(coef[row][free_col] * x[free_col])
-    # Total = sum of all x = sum of pivot vars + sum of free vars
-    #       = sum(rhs) - sum(coef * free) + sum(free)
 
-    # Compute objective coefficients for free variables
-    # obj = constant + sum(obj_coef[i] * free[i])
-    obj_constant = Fraction(0)
-    obj_coefs = [Fraction(1)] * len(free_cols)  # Each free var contributes 1 directly
+def pivot(tableau: list[list[Fraction]], row: int, col: int) -> None:
+    """Pivot a tableau on one entry, touching only the pivot row's nonzeros.
 
-    for row, _pivot_col in enumerate(pivot_cols):
-        obj_constant += matrix[row][n_buttons]
-        for i, free_col in enumerate(free_cols):
-            # Pivot var contribution: -coef * free
-            obj_coefs[i] -= matrix[row][free_col]
+    Args:
+        tableau: Constraint rows, modified in place
+        row: Pivot row index
+        col: Pivot column index
+    """
+    pivot_row = tableau[row]
+    scale = pivot_row[col]
+    nonzero = [k for k, v in enumerate(pivot_row) if v]
+    for k in nonzero:
+        pivot_row[k] /= scale
+    for r, other in enumerate(tableau):
+        factor = other[col]
+        if r != row and factor:
+            for k in nonzero:
+                other[k] -= factor * pivot_row[k]
+
+
+def simplex(
+    tableau: list[list[Fraction]], basis: list[int], cost: list[Fraction], allowed: int
+) -> None:
+    """Minimise a cost over a tableau in canonical form, in place.
+
+    Each tableau row is coefficients followed by the right-hand side, and
+    basis[r] is the variable that row r solves for. Bland's rule (lowest index
+    enters and leaves) prevents cycling.
 
-    # Now find minimum over non-negative integer free vars such that all pivot vars are non-negative integers
-    # Constraint for each pivot var: rhs - sum(coef * free) >= 0 and integer
+    Args:
+        tableau: Constraint rows, modified in place
+        basis: Basic variable of each row, modified in place
+        cost: Cost of every variable
+        allowed: Only variables below this index may enter the basis
+    """
+    while True:
+        costed = [(cost[var], row) for var, row in zip(basis, tableau, strict=True) if cost[var]]
+        entering = None
+        for j in range(allowed):
+            reduced = cost[j] - sum(c * row[j] for c, row in costed if row[j])
+            if reduced < 0:
+                entering = j
+                break
+        if entering is None:
+            return
 
-    def get_solution(free_vals: list[int]) -> list[int] | None:
-        """Given values for free variables, compute full solution."""
-        solution = [Fraction(0)] * n_buttons
+        leaving = None
+        best: tuple[Fraction, int] | None = None
+        for r, row in enumerate(tableau):
+            if row[entering] > 0:
+                key = (row[-1] / row[entering], basis[r])
+                if best is None or key < best:
+                    leaving, best = r, key
+        if leaving is None:
+            raise ValueError("LP relaxation is unbounded")
 
-        for i, col in enumerate(free_cols):
-            solution[col] = Fraction(free_vals[i])
+        pivot(tableau, leaving, entering)
+        basis[leaving] = entering
 
-        for row, pivot_col in enumerate(pivot_cols):
-            val = matrix[row][n_buttons]
-            for i, free_col in enumerate(free_cols):
-                val -= matrix[row][free_col] * free_vals[i]
-            solution[pivot_col] = val
 
-        for s in solution:
-            if s < 0 or s.denominator != 1:
-                return None
+def lp_relaxation(
+    matrix: list[list[int]], rhs: list[int], lo: list[int], hi: list[int]
+) -> tuple[Fraction, list[Fraction]] | None:
+    """Minimise sum(x) subject to matrix @ x = rhs and lo <= x <= hi over the rationals.
 
-        return [int(s) for s in solution]
+    Variables are shifted by their lower bounds, upper bounds become slack
+    rows, and a two-phase exact simplex finds a feasible basis with artificial
+    variables before optimising.
 
-    # Search over free variable space
-    import math
+    Args:
+        matrix: Constraint coefficients, one row per counter
+        rhs: Constraint right-hand sides
+        lo: Lower bound of each variable
+        hi: Upper bound of each variable
 
-    max_target = max(target)
+    Returns:
+        Tuple of (optimal objective, optimal x), or None if infeasible
+    """
+    n = len(lo)
+    m = len(matrix)
+    if any(h < low for low, h in zip(lo, hi, strict=True)):
+        return None
+
+    # Columns: shifted x (n), upper-bound slacks (n), artificials (m), rhs
+    width = 2 * n + m + 1
+    tableau: list[list[Fraction]] = []
+    basis: list[int] = []
+    for i, coefs in enumerate(matrix):
+        shifted = rhs[i] - sum(a * low for a, low in zip(coefs, lo, strict=True))
+        sign = -1 if shifted < 0 else 1
+        line = [Fraction(sign * a) for a in coefs]
+        line += [Fraction(0)] * (n + m) + [Fraction(sign * shifted)]
+        line[2 * n + i] = Fraction(1)
+        tableau.append(line)
+        basis.append(2 * n + i)
+    for j in range(n):
+        line = [Fraction(0)] * width
+        line[j] = line[n + j] = Fraction(1)
+        line[-1] = Fraction(hi[j] - lo[j])
+        tableau.append(line)
+        basis.append(n + j)
+
+    phase1 = [Fraction(0)] * (2 * n) + [Fraction(1)] * m
+    simplex(tableau, basis, phase1, 2 * n + m)
+    if any(row[-1] for row, var in zip(tableau, basis, strict=True) if var >= 2 * n):
+        return None
+
+    # Pivot zero-level artificials out of the basis where possible
+    for r, row in enumerate(tableau):
+        if basis[r] >= 2 * n:
+            col = next((j for j in range(2 * n) if row[j]), None)
+            if col is not None:
+                pivot(tableau, r, col)
+                basis[r] = col
+
+    phase2 = [Fraction(1)] * n + [Fraction(0)] * (n + m)
+    simplex(tableau, basis, phase2, 2 * n)
+
+    x = [Fraction(low) for low in lo]
+    for row, var in zip(tableau, basis, strict=True):
+        if var < n:
+            x[var] += row[-1]
+    return sum(x, Fraction(0)), x
+
+
+def solve_machine_ilp(target: list[int], buttons: list[list[int]]) -> int:
+    """Find minimum button presses with LP-based branch and bound.
+
+    Every node solves the LP relaxation exactly. Since the objective is a sum
+    of integers, a node is pruned once the ceiling of its LP bound cannot beat
+    the incumbent; otherwise it branches on the first fractional press count.
 
-    def compute_bounds(idx: int, current: list[int]) -> tuple[int, int]:
-        """Compute bounds for free variable at index idx given current assignment.
+    Args:
+        target: Target joltage values for each counter
+        buttons: List of button indices (which counters each button affects)
 
-        When all prior free variables are assigned, we can compute exact bounds.
-        """
-        free_col = free_cols[idx]
+    Returns:
+        Minimum number of button presses needed
+    """
+    n_buttons = len(buttons)
+    matrix = [[1 if i in button else 0 for button in buttons] for i in range(len(target))]
+    # A button can't be pressed more often than any counter it feeds allows
+    hi = [min((target[i] for i in button if i < len(target)), default=0) for button in buttons]
+    best = -1
+    stack = [([0] * n_buttons, hi)]
+
+    while stack:
+        lo, hi = stack.pop()
+        relaxed = lp_relaxation(matrix, target, lo, hi)
+        if relaxed is None:
+            continue
+        bound, x = relaxed
+        if best != -1 and math.ceil(bound) >= best:
+            continue
 
-        # Start with wide bounds - any free var value up to 2x max target should suffice
-        lo, hi = 0, max_target * 3
+        fractional = next((j for j, v in enumerate(x) if v.denominator != 1), None)
+        if fractional is None:
+            best = int(bound)
+            continue
 
-        for row, _pivot_col in enumerate(pivot_cols):
-            # Effective RHS after accounting for already-assigned free variables
-            effective_rhs = matrix[row][n_buttons]
-            for i in range(idx):
-                effective_rhs -= matrix[row][free_cols[i]] * current[i]
+        value = x[fractional]
+        down = hi.copy()
+        down[fractional] = math.floor(value)
+        up = lo.copy()
+        up[fractional] = math.ceil(value)
+        # Explore rounding down first
+        stack.append((up, hi))
+        stack.append((lo, down))
 
-            coef = matrix[row][free_col]
+    return best
 
-            # Check if any remaining free variables (after idx) affect this constraint
-            has_remaining_free = False
-            for j in range(idx + 1, len(free_cols)):
-                if matrix[row][free_cols[j]] != 0:
-                    has_remaining_free = True
-                    break
 
-            # Only apply tight bounds when this is the last free variable affecting
-            # this constraint, or when we can guarantee the bound is valid
-            if not has_remaining_free:
-                if coef > 0:
-                    # effective_rhs - coef * free >= 0 => free <= effective_rhs / coef
-                    if effective_rhs >= 0:
-                        upper = int(effective_rhs / coef)
-                        hi = min(hi, upper)
-                    else:
-                        # No valid value for this var can satisfy constraint
-                        return (1, 0)  # Invalid range
-                elif coef < 0 and effective_rhs < 0:
-                    # effective_rhs - coef * free >= 0 => free >= effective_rhs / coef
-                    lower = math.ceil(float(-effective_rhs) / float(-coef))
-                    lo = max(lo, lower)
-
-        return (max(0, lo), max(lo, hi))
-
-    # Search with dynamic bounds and objective-based pruning
-    best = float("inf")
-
-    def search(idx: int, current: list[int]) -> None:
-        nonlocal best
+# A machine reduced to (part, target, sorted button masks)
+Signature = tuple[int, tuple[int, ...], tuple[int, ...]]
 
-        if idx == len(free_cols):
-            sol = get_solution(current)
-            if sol is not None:
-                total = sum(sol)
-                best = min(best, total)
-            return
+# Number of solved signatures kept in the in-process memo
+MEMO_SIZE = 4096
 
-        lo, hi = compute_bounds(idx, current)
-        if lo > hi:
-            return  # No feasible values
 
-        coef = float(obj_coefs[idx])
+def machine_signature(part: int, target: Iterable[int], buttons: list[list[int]]) -> Signature:
+    """Normalise a machine so that equivalent machines share a memo entry.
 
-        # Compute current partial objective
-        partial_obj = float(obj_constant)
-        for i in range(idx):
-            partial_obj += float(obj_coefs[i]) * current[i]
+    Buttons become bitmasks and are sorted, so machines that only list their
+    buttons (or a button's counters) in a different order hash the same.
 
-        # Check if any remaining variables have negative coefficients
-        has_negative_remaining = any(obj_coefs[j] < 0 for j in range(idx + 1, len(free_cols)))
+    Args:
+        part: Puzzle part the machine is solved for (1 or 2)
+        target: Light states (as 0/1) or joltage values
+        buttons: List of button indices (which counters each button affects)
 
-        if coef >= 0 and not has_negative_remaining:
-            # Can prune: as val increases, objective increases, and no future var can decrease it
-            for val in range(lo, hi + 1):
-                test_obj = partial_obj + coef * val
-                if test_obj >= best:
-                    break
-                search(idx + 1, [*current, val])
-        elif coef >= 0:
-            # Can't prune: future variables might decrease objective
-            for val in range(lo, hi + 1):
-                search(idx + 1, [*current, val])
+    Returns:
+        The machine signature
+    """
+    masks = sorted(sum(1 << i for i in set(button)) for button in buttons)
+    return part, tuple(int(t) for t in target), tuple(masks)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def solve_signature(signature: Signature) -> int:
+    """Solve a machine signature for its part, memoised in-process.
+
+    Args:
+        signature: The machine signature
+
+    Returns:
+        Minimum number of button presses needed (-1 if unreachable)
+    """
+    part, target, masks = signature
+    buttons = [mask_indices(mask) for mask in masks]
+    if part == 1:
+        return solve_machine_gf2([bool(t) for t in target], buttons)
+    return solve_machine_ilp(list(target), buttons)
+
+
+def _raise_timeout(signum: int, frame: object) -> None:
+    """Abort the machine being solved when its time budget runs out."""
+    raise TimeoutError
+
+
+def timed_solve(signature: Signature, timeout: float | None = None) -> tuple[int | None, float]:
+    """Solve a signature under an optional wall-clock budget.
+
+    The budget is enforced with an interval timer, so it only applies on
+    platforms with SIGALRM and when called from the main thread (which is
+    always the case inside a pool worker).
+
+    Args:
+        signature: The machine signature
+        timeout: Seconds allowed for this machine (None for no limit)
+
+    Returns:
+        Tuple of (presses or None if the machine timed out, seconds taken)
+    """
+    alarm = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+    alarm = alarm and timeout is not None
+    start = time.perf_counter()
+    if alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    try:
+        if alarm and timeout is not None:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        result: int | None = solve_signature(signature)
+        # Disarm while still inside the try, so a late alarm is caught here
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except TimeoutError:
+        result = None
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+    return result, time.perf_counter() - start
+
+
+def _open_memo(
+    cache_path: str | None,
+) -> AbstractContextManager[MutableMapping[str, tuple[int | None, float]]]:
+    """Open the disk memo, or an empty in-memory one if there is no path."""
+    if cache_path is None:
+        return nullcontext({})
+    return shelve.open(cache_path)
+
+
+def solve_machines(
+    signatures: Iterable[Signature],
+    workers: int | None = None,
+    timeout: float | None = None,
+    cache_path: str | None = None,
+) -> dict[Signature, tuple[int | None, float]]:
+    """Solve every distinct machine once, across a process pool.
+
+    Duplicate signatures are solved once. Signatures already in the disk memo
+    are not solved again, and newly solved ones (but not timed-out ones) are
+    written back to it.
+
+    Args:
+        signatures: Machine signatures, possibly repeated
+        workers: Number of worker processes (None for one per CPU, 1 to
+            solve in this process)
+        timeout: Seconds allowed per machine (None for no limit)
+        cache_path: Path of a shelve file used as a disk memo (None for none)
+
+    Returns:
+        Dict mapping each distinct signature to (presses or None if it timed
+        out, seconds taken to solve it)
+    """
+    unique = list(dict.fromkeys(signatures))
+    report: dict[Signature, tuple[int | None, float]] = {}
+    with _open_memo(cache_path) as stored:
+        for signature in unique:
+            if repr(signature) in stored:
+                report[signature] = stored[repr(signature)]
+        pending = [signature for signature in unique if signature not in report]
+
+        if workers == 1 or len(pending) < 2:
+            solved = [timed_solve(signature, timeout) for signature in pending]
         else:
-            # Prefer larger values - as val increases, objective decreases
-            for val in range(hi, lo - 1, -1):
-                search(idx + 1, [*current, val])
+            workers = workers or os.cpu_count() or 1
+            # Machines vary wildly in cost, so hand them out one at a time
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                solved = list(executor.map(timed_solve, pending, repeat(timeout)))
+
+        for signature, outcome in zip(pending, solved, strict=True):
+            report[signature] = outcome
+            if outcome[0] is not None:
+                stored[repr(signature)] = outcome
 
-    search(0, [])
+    return report
 
-    return int(best) if best != float("inf") else -1
+
+def slowest_machines(
+    report: dict[Signature, tuple[int | None, float]], count: int = 5
+) -> list[tuple[Signature, float]]:
+    """List the machines that took longest to solve.
+
+    Args:
+        report: Result of solve_machines
+        count: Number of machines to list
+
+    Returns:
+        List of (signature, seconds) tuples, slowest first
+    """
+    timings = ((signature, elapsed) for signature, (_, elapsed) in report.items())
+    return sorted(timings, key=lambda item: item[1], reverse=True)[:count]
 
 
 def part2(data: str) -> int:
@@ -370,9 +859,8 @@ def part2(data: str) -> int:
     """
     total = 0
 
-    for line in data.strip().split("\n"):
-        target, buttons = parse_machine_part2(line)
-        presses = solve_machine_part2(target, buttons)
+    for machine in parse_machines(data):
+        presses = solve_signature(machine.signature(2))
         total += presses
 
     return total
@@ -1,12 +1,31 @@
 """Tests for Day 10: Factory."""
 
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+from solutions.day10 import day10
 from solutions.day10.day10 import (
+    Machine,
+    eliminate,
+    gray_code_presses,
+    lp_relaxation,
+    machine_signature,
     parse_machine,
     parse_machine_part2,
+    parse_machines,
     part1,
     part2,
+    slowest_machines,
     solve_machine,
+    solve_machine_gf2,
+    solve_machine_ilp,
     solve_machine_part2,
+    solve_machines,
+    solve_signature,
+    timed_solve,
+    to_masks,
 )
 
 EXAMPLE_INPUT = """[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}
@@ -35,6 +54,48 @@ class TestParseMachine:
         assert len(buttons) == 4
 
 
+class TestMachine:
+    """Tests for the Machine record."""
+
+    def test_parse(self) -> None:
+        """Test the diagram, buttons and joltage come out of one scan."""
+        machine = Machine.parse("[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}")
+        assert machine.lights == 0b0110
+        assert machine.width == 4
+        assert machine.buttons == (0b1000, 0b1010, 0b0100, 0b1100, 0b0101, 0b0011)
+        assert machine.joltage == (3, 5, 4, 7)
+        assert machine.button_indices()[1] == [1, 3]
+
+    def test_signature(self) -> None:
+        """Test the signatures match those built from parsed lists."""
+        for line in EXAMPLE_INPUT.splitlines():
+            machine = Machine.parse(line)
+            assert machine.signature(1) == machine_signature(1, *parse_machine(line))
+            assert machine.signature(2) == machine_signature(2, *parse_machine_part2(line))
+
+    def test_missing_blocks(self) -> None:
+        """Test each part only needs its own block."""
+        assert parse_machine("[.##.] (3) (1,3)") == ([False, True, True, False], [[3], [1, 3]])
+        assert parse_machine_part2("(0) {1}") == ([1], [[0]])
+        with pytest.raises(ValueError, match="diagram"):
+            parse_machine("(0) {1}")
+        with pytest.raises(ValueError, match="joltage"):
+            parse_machine_part2("[#] (0)")
+        with pytest.raises(ValueError, match="joltage"):
+            Machine.parse("[#] (0)").signature(2)
+
+    def test_repeated_index(self) -> None:
+        """Test a counter listed twice in a button is still that counter."""
+        machine = Machine.parse("[.#] (1,1) {0,1}")
+        assert machine.buttons == (0b10,)
+        assert machine.signature(1) == machine_signature(1, [0, 1], [[1, 1]])
+
+    def test_parse_machines_shared(self) -> None:
+        """Test both parts reuse one parse of the same input."""
+        assert parse_machines(EXAMPLE_INPUT) is parse_machines(EXAMPLE_INPUT)
+        assert len(parse_machines(EXAMPLE_INPUT)) == 3
+
+
 class TestSolveMachine:
     """Tests for solve_machine function."""
 
@@ -57,6 +118,60 @@ class TestSolveMachine:
         assert solve_machine(target, buttons) == 2
 
 
+class TestGrayCodePresses:
+    """Tests for gray_code_presses function."""
+
+    def test_all_states(self) -> None:
+        """Every reachable state maps to its fewest presses."""
+        assert gray_code_presses([0b01, 0b10, 0b11]) == {0: 0, 0b01: 1, 0b10: 1, 0b11: 1}
+
+    def test_to_masks(self) -> None:
+        """Targets and buttons become bitmasks over the lights."""
+        assert to_masks([False, True, True], [[0, 2], [1], [5]]) == (0b110, [0b101, 0b010, 0])
+
+
+class TestMeetInTheMiddle:
+    """Tests for the meet-in-the-middle path of solve_machine."""
+
+    def test_example_machines(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Splitting every machine in half gives the same answers."""
+        monkeypatch.setattr(day10, "GRAY_CODE_MAX_BUTTONS", 0)
+        assert part1(EXAMPLE_INPUT) == 7
+
+    def test_many_buttons(self) -> None:
+        """Machines with many buttons are solved by meeting in the middle."""
+        n_lights = 24
+        buttons = [[i] for i in range(n_lights)] + [list(range(0, n_lights, 2))] * 6
+        target = [i % 2 == 0 for i in range(n_lights)]
+        assert solve_machine(target, buttons) == 1
+
+    def test_unreachable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unreachable targets give -1."""
+        monkeypatch.setattr(day10, "GRAY_CODE_MAX_BUTTONS", 0)
+        assert solve_machine([True, False], [[1], [1]]) == -1
+
+
+class TestSolveMachineGf2:
+    """Tests for solve_machine_gf2 function."""
+
+    def test_example_machines(self) -> None:
+        """GF(2) elimination matches the exhaustive search on the examples."""
+        for line in EXAMPLE_INPUT.split("\n"):
+            target, buttons = parse_machine(line)
+            assert solve_machine_gf2(target, buttons) == solve_machine(target, buttons)
+
+    def test_large_kernel_free_machine(self) -> None:
+        """Independent buttons leave nothing to enumerate."""
+        n_lights = 60
+        buttons = [[i, i + 1] for i in range(n_lights - 1)] + [[n_lights - 1]]
+        target = [True] + [False] * (n_lights - 1)
+        assert solve_machine_gf2(target, buttons) == n_lights
+
+    def test_inconsistent(self) -> None:
+        """Unreachable targets give -1."""
+        assert solve_machine_gf2([True, False], [[1], [1]]) == -1
+
+
 class TestPart1:
     """Tests for part1 function."""
 
@@ -77,6 +192,24 @@ class TestParseMachinePart2:
         assert len(buttons) == 6
 
 
+class TestEliminate:
+    """Tests for eliminate function."""
+
+    def test_integer_rows(self) -> None:
+        """Pivot rows stay integral with positive pivots."""
+        reduced = eliminate([3, 5, 4, 7], [[3], [1, 3], [2], [2, 3], [0, 2], [0, 1]])
+        assert reduced is not None
+        rows, pivot_cols = reduced
+        assert len(rows) == len(pivot_cols) == 4
+        for row, col in zip(rows, pivot_cols, strict=True):
+            assert all(isinstance(v, int) for v in row)
+            assert row[col] > 0
+
+    def test_inconsistent(self) -> None:
+        """Contradictory counters give None."""
+        assert eliminate([1, 2], [[0, 1]]) is None
+
+
 class TestSolveMachinePart2:
     """Tests for solve_machine_part2 function."""
 
@@ -98,6 +231,56 @@ class TestSolveMachinePart2:
         buttons = [[0, 1, 2, 3, 4], [0, 3, 4], [0, 1, 2, 4, 5], [1, 2]]
         assert solve_machine_part2(target, buttons) == 11
 
+    def test_non_unit_pivot(self) -> None:
+        """Rows that need a common denominator are solved exactly."""
+        # x0 + x1 = 3, x1 + x2 = 3, x0 + x2 = 4 has the unique solution (2, 1, 2)
+        assert solve_machine_part2([3, 3, 4], [[0, 2], [0, 1], [1, 2]]) == 5
+        # The same counters with odd parity have no integer solution
+        assert solve_machine_part2([3, 3, 3], [[0, 2], [0, 1], [1, 2]]) == -1
+
+
+class TestLpRelaxation:
+    """Tests for lp_relaxation function."""
+
+    def test_fractional_optimum(self) -> None:
+        """A triangle of pair buttons is covered by half presses."""
+        matrix = [[1, 0, 1], [1, 1, 0], [0, 1, 1]]
+        result = lp_relaxation(matrix, [1, 1, 1], [0, 0, 0], [1, 1, 1])
+        assert result is not None
+        bound, x = result
+        assert bound == Fraction(3, 2)
+        assert x == [Fraction(1, 2)] * 3
+
+    def test_bounds(self) -> None:
+        """Lower and upper bounds are respected or reported infeasible."""
+        matrix = [[1, 1]]
+        assert lp_relaxation(matrix, [5], [0, 4], [5, 5]) == (
+            Fraction(5),
+            [Fraction(1), Fraction(4)],
+        )
+        assert lp_relaxation(matrix, [5], [0, 0], [2, 2]) is None
+        assert lp_relaxation(matrix, [5], [3, 0], [2, 5]) is None
+
+
+class TestSolveMachineIlp:
+    """Tests for solve_machine_ilp function."""
+
+    def test_example_machines(self) -> None:
+        """Test the example machines match the elimination solver."""
+        for line, expected in zip(EXAMPLE_INPUT.splitlines(), [10, 12, 11], strict=True):
+            target, buttons = parse_machine_part2(line)
+            assert solve_machine_ilp(target, buttons) == expected
+
+    def test_branches_past_fractional_bound(self) -> None:
+        """An LP bound of 1.5 is tightened to the integer optimum."""
+        buttons = [[0, 1], [1, 2], [0, 2], [0], [1], [2]]
+        assert solve_machine_ilp([1, 1, 1], buttons) == 2
+
+    def test_non_unit_pivot(self) -> None:
+        """Test the cases that need a common denominator."""
+        assert solve_machine_ilp([3, 3, 4], [[0, 2], [0, 1], [1, 2]]) == 5
+        assert solve_machine_ilp([3, 3, 3], [[0, 2], [0, 1], [1, 2]]) == -1
+
 
 class TestPart2:
     """Tests for part2 function."""
@@ -106,3 +289,77 @@ class TestPart2:
         """Test part 2 with example input."""
         result = part2(EXAMPLE_INPUT)
         assert result == 33
+
+
+class TestMachineSignature:
+    """Tests for machine_signature function."""
+
+    def test_order_insensitive(self) -> None:
+        """Reordered buttons and counters within a button hash the same."""
+        first = machine_signature(2, [3, 5], [[0], [1, 0]])
+        second = machine_signature(2, [3, 5], [[0, 1], [0]])
+        assert first == second == (2, (3, 5), (1, 3))
+
+    def test_parts_differ(self) -> None:
+        """The same machine is memoised separately for each part."""
+        assert machine_signature(1, [1, 0], [[0]]) != machine_signature(2, [1, 0], [[0]])
+
+    def test_solve_signature(self) -> None:
+        """Signatures solve to the same answers as the machines."""
+        for line, expected in zip(EXAMPLE_INPUT.splitlines(), [2, 3, 2], strict=True):
+            target, buttons = parse_machine(line)
+            assert solve_signature(machine_signature(1, target, buttons)) == expected
+        for line, expected in zip(EXAMPLE_INPUT.splitlines(), [10, 12, 11], strict=True):
+            joltage, buttons = parse_machine_part2(line)
+            assert solve_signature(machine_signature(2, joltage, buttons)) == expected
+
+
+class TestSolveMachines:
+    """Tests for solve_machines and slowest_machines functions."""
+
+    def signatures(self) -> list[day10.Signature]:
+        """Return the example machines for part 2, with a duplicate."""
+        lines = EXAMPLE_INPUT.splitlines()
+        return [machine_signature(2, *parse_machine_part2(line)) for line in [*lines, lines[0]]]
+
+    def test_deduplicates(self) -> None:
+        """Repeated machines are solved once."""
+        report = solve_machines(self.signatures(), workers=1)
+        assert [result for result, _ in report.values()] == [10, 12, 11]
+
+    def test_pool(self) -> None:
+        """A process pool gives the same answers."""
+        report = solve_machines(self.signatures(), workers=2)
+        assert [result for result, _ in report.values()] == [10, 12, 11]
+        slowest = slowest_machines(report, count=2)
+        assert len(slowest) == 2
+        assert slowest[0][1] >= slowest[1][1]
+
+    def test_disk_memo(self, tmp_path: Path) -> None:
+        """Solved machines, timings included, are read back from the disk memo."""
+        cache_path = str(tmp_path / "memo")
+        first = solve_machines(self.signatures(), workers=1, cache_path=cache_path)
+        second = solve_machines(self.signatures(), workers=1, cache_path=cache_path)
+        assert second == first
+
+    def test_timeout(self) -> None:
+        """A machine that runs past its budget is reported as None."""
+        target = [1001, 747, 1092, 699, 769, 696, 945, 898, 641]
+        buttons = [
+            [0, 1, 2, 3, 4, 5, 6, 7],
+            [0, 2, 3, 6],
+            [0, 1, 2, 4, 7, 8],
+            [2],
+            [7],
+            [0, 1, 2, 3, 4, 5, 6, 8],
+            [1, 2, 4, 5, 6, 7],
+            [4],
+            [0, 5],
+            [2, 6, 7, 8],
+            [0, 1, 3, 6, 7, 8],
+            [0, 2, 3, 4, 5, 6, 7, 8],
+            [0, 1, 2, 3, 4, 5, 7, 8],
+        ]
+        result, elapsed = timed_solve(machine_signature(2, target, buttons), timeout=0.01)
+        assert result is None
+        assert elapsed < 0.5
@@ -0,0 +1,59 @@
+"""Benchmarks for Day 6: Trash Compactor.
+
+Run with `python -m solutions.day6.bench_day6`.
+"""
+
+import math
+import random
+import time
+from collections.abc import Callable
+from functools import partial
+
+from solutions.day6.day6 import parse_problems, product_tree, solve_all
+
+
+def make_worksheet(num_problems: int, num_rows: int, digits: int, seed: int = 0) -> str:
+    """Generate a wide worksheet of multiplication problems.
+
+    Args:
+        num_problems: Number of problems (columns of numbers)
+        num_rows: Number of operand rows per problem
+        digits: Number of digits in each operand
+        seed: Random seed
+
+    Returns:
+        The worksheet in puzzle input format
+    """
+    rng = random.Random(seed)
+    rows = [
+        " ".join(str(rng.randrange(10 ** (digits - 1), 10**digits)) for _ in range(num_problems))
+        for _ in range(num_rows)
+    ]
+    rows.append(" ".join("*".ljust(digits) for _ in range(num_problems)))
+    return "\n".join(rows)
+
+
+def timed(label: str, fn: Callable[[], object]) -> float:
+    """Run fn once and print its wall-clock time."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s")
+    return elapsed
+
+
+def main() -> None:
+    """Compare product strategies and sequential vs. pooled solving."""
+    data = make_worksheet(num_problems=2000, num_rows=64, digits=200)
+    timed("parse 2000 x 64 x 200-digit", lambda: parse_problems(data))
+    problems = parse_problems(data)
+
+    timed("math.prod", lambda: [math.prod(numbers) for numbers, _ in problems])
+    timed("product_tree", lambda: [product_tree(numbers) for numbers, _ in problems])
+
+    for workers in (1, 2, 4, 8):
+        timed(f"solve_all workers={workers}", partial(solve_all, problems, workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,80 @@
 """Day 6: Trash Compactor - Advent of Code 2025."""
 
 import math
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 
 from solutions.utils import get_input
 
+# Below this many factors a plain left-to-right product is faster than a tree
+PRODUCT_TREE_MIN = 8
+
+# Translation table mapping a space to 0 and every other byte to 1
+_OCCUPIED = bytes(0 if byte == ord(" ") else 1 for byte in range(256))
+
+
+def column_spans(lines: list[str]) -> Iterator[tuple[int, int]]:
+    """Yield the column spans of the problems in a worksheet.
+
+    Problems are separated by columns that are entirely spaces. The occupancy
+    of every column is computed in a single pass by translating each row to a
+    0/1 byte string and OR-ing the rows together as integers, so lines do not
+    need to be padded first.
+
+    Args:
+        lines: The worksheet rows (may have different lengths)
+
+    Returns:
+        Iterator of (start, end) column spans, end exclusive
+    """
+    width = max((len(line) for line in lines), default=0)
+    mask = 0
+    for line in lines:
+        row = line.encode().translate(_OCCUPIED)
+        # Left-align the row so column 0 is always the most significant byte
+        mask |= int.from_bytes(row) << (8 * (width - len(row)))
+    occupied = mask.to_bytes(width)
+
+    col = occupied.find(1)
+    while col != -1:
+        end = occupied.find(0, col)
+        if end == -1:
+            end = width
+        yield col, end
+        col = occupied.find(1, end)
+
+
+def _operation(line: str, start: int, end: int) -> str | None:
+    """Read the operation of the problem in the given column span."""
+    op = line[start:end].strip()
+    return op if op in ("+", "*") else None
+
+
+def _read_horizontal(rows: list[str], start: int, end: int) -> list[int]:
+    """Read one number per row from the given column span."""
+    numbers = []
+    for row in rows:
+        chunk = row[start:end]
+        if chunk and not chunk.isspace():
+            numbers.append(int(chunk))
+    return numbers
+
+
+def _read_vertical(rows: list[str], start: int, end: int) -> list[int]:
+    """Read one number per column from the given column span.
+
+    Top-to-bottom gives most significant to least significant digit.
+    """
+    width = end - start
+    chunks = [row[start:end].ljust(width) for row in rows]
+    numbers = []
+    for column in zip(*chunks, strict=True):
+        digits = "".join(char for char in column if char.isdigit())
+        if digits:
+            numbers.append(int(digits))
+    return numbers
+
 
 def parse_problems(data: str) -> list[tuple[list[int], str]]:
     """Parse the worksheet into individual problems.
@@ -17,50 +88,40 @@ def parse_problems(data: str) -> list[tuple[list[int], str]]:
         List of (numbers, operation) tuples
     """
     lines = data.split("\n")
-    if not lines:
-        return []
-
-    # Pad all lines to the same length
-    max_len = max(len(line) for line in lines)
-    lines = [line.ljust(max_len) for line in lines]
-
-    # Find column boundaries by looking for all-space columns
-    # Problems are separated by columns that are entirely spaces
-    num_rows = len(lines)
     problems = []
 
-    # Track which columns belong to which problem
-    col = 0
-    while col < max_len:
-        # Skip separator columns (all spaces)
-        while col < max_len and all(lines[row][col] == " " for row in range(num_rows)):
-            col += 1
+    for start, end in column_spans(lines):
+        # Last line contains the operation
+        operation = _operation(lines[-1], start, end)
+        if operation:
+            problems.append((_read_horizontal(lines[:-1], start, end), operation))
 
-        if col >= max_len:
-            break
+    return problems
 
-        # Find the end of this problem (next all-space column or end)
-        start_col = col
-        while col < max_len and not all(lines[row][col] == " " for row in range(num_rows)):
-            col += 1
 
-        # Extract the problem from start_col to col
-        problem_lines = [line[start_col:col] for line in lines]
+def product_tree(numbers: Sequence[int]) -> int:
+    """Multiply numbers as a balanced binary tree.
 
-        # Last line contains the operation
-        op_line = problem_lines[-1].strip()
-        operation = op_line if op_line in ("+", "*") else None
+    Pairing factors of similar size keeps big-integer multiplications
+    balanced, which is much faster than a left-to-right product when the
+    operands have many digits.
 
-        if operation:
-            # Parse numbers from the lines above the operation
-            numbers = []
-            for line in problem_lines[:-1]:
-                stripped = line.strip()
-                if stripped:
-                    numbers.append(int(stripped))
-            problems.append((numbers, operation))
+    Args:
+        numbers: Numbers to multiply
 
-    return problems
+    Returns:
+        The product of all numbers (1 if empty)
+    """
+    if len(numbers) < PRODUCT_TREE_MIN:
+        return math.prod(numbers)
+
+    level = list(numbers)
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
 
 
 def solve_problem(numbers: list[int], operation: str) -> int:
@@ -76,7 +137,29 @@ def solve_problem(numbers: list[int], operation: str) -> int:
     if operation == "+":
         return sum(numbers)
     else:  # "*"
-        return math.prod(numbers)
+        return product_tree(numbers)
+
+
+def solve_all(problems: list[tuple[list[int], str]], workers: int | None = None) -> int:
+    """Solve independent problems across a process pool and sum the results.
+
+    Args:
+        problems: List of (numbers, operation) tuples
+        workers: Number of worker processes (None for one per CPU, 1 to
+            solve in this process)
+
+    Returns:
+        Sum of all problem answers
+    """
+    if workers == 1 or len(problems) < 2:
+        return sum(solve_problem(numbers, op) for numbers, op in problems)
+
+    workers = workers or os.cpu_count() or 1
+    numbers = [problem[0] for problem in problems]
+    operations = [problem[1] for problem in problems]
+    chunksize = max(1, len(problems) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(solve_problem, numbers, operations, chunksize=chunksize))
 
 
 def part1(data: str) -> int:
@@ -107,49 +190,13 @@ def parse_problems_vertical(data: str) -> list[tuple[list[int], str]]:
         List of (numbers, operation) tuples
     """
     lines = data.split("\n")
-    if not lines:
-        return []
-
-    # Pad all lines to the same length
-    max_len = max(len(line) for line in lines)
-    lines = [line.ljust(max_len) for line in lines]
-
-    num_rows = len(lines)
     problems = []
 
-    # Track which columns belong to which problem
-    col = 0
-    while col < max_len:
-        # Skip separator columns (all spaces)
-        while col < max_len and all(lines[row][col] == " " for row in range(num_rows)):
-            col += 1
-
-        if col >= max_len:
-            break
-
-        # Find the end of this problem (next all-space column or end)
-        start_col = col
-        while col < max_len and not all(lines[row][col] == " " for row in range(num_rows)):
-            col += 1
-
-        # Extract the problem columns from start_col to col
-        # Last row contains the operation
-        op_line = lines[-1][start_col:col].strip()
-        operation = op_line if op_line in ("+", "*") else None
-
+    for start, end in column_spans(lines):
+        # Last line contains the operation
+        operation = _operation(lines[-1], start, end)
         if operation:
-            # Read numbers vertically - each column is a number
-            # Top-to-bottom gives most significant to least significant digit
-            numbers = []
-            for c in range(start_col, col):
-                digits = ""
-                for row in range(num_rows - 1):  # Exclude operation row
-                    char = lines[row][c]
-                    if char.isdigit():
-                        digits += char
-                if digits:
-                    numbers.append(int(digits))
-            problems.append((numbers, operation))
+            problems.append((_read_vertical(lines[:-1], start, end), operation))
 
     return problems
 
@@ -169,6 +216,111 @@ def part2(data: str) -> int:
     return sum(solve_problem(numbers, op) for numbers, op in problems)
 
 
+def stream_problems(
+    rows: list[Iterator[str]], vertical: bool = False
+) -> Iterator[tuple[list[int], str]]:
+    """Parse problems from row-wise chunk streams as soon as they are complete.
+
+    Each row of the worksheet is supplied as its own iterator of successive
+    chunks, so the worksheet is walked left to right in bounded column windows.
+    A problem is emitted once a separator column after it has been seen in every
+    row, which keeps only the widest open problem plus one window in memory.
+
+    Args:
+        rows: One chunk iterator per worksheet row, operation row last
+        vertical: Read numbers column by column instead of row by row
+
+    Returns:
+        Iterator of (numbers, operation) tuples
+    """
+    read = _read_vertical if vertical else _read_horizontal
+    buffers = [""] * len(rows)
+    live = [True] * len(rows)
+
+    while any(live):
+        for i, chunks in enumerate(rows):
+            if live[i]:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    live[i] = False
+                else:
+                    buffers[i] += chunk
+
+        done = not any(live)
+        # Columns before `known` are final in every row
+        lengths = [len(buffer) for buffer, alive in zip(buffers, live, strict=True) if alive]
+        known = max(len(buffer) for buffer in buffers) if done else min(lengths)
+        window = [buffer[:known] for buffer in buffers]
+
+        consumed = known
+        for start, end in column_spans(window):
+            if end == known and not done:
+                # The problem may continue in the next window
+                consumed = start
+                break
+            operation = _operation(window[-1], start, end)
+            if operation:
+                yield read(window[:-1], start, end), operation
+
+        buffers = [buffer[consumed:] for buffer in buffers]
+
+
+def row_chunks(path: str, window: int = 4096) -> list[Iterator[str]]:
+    """Open a worksheet file as one chunk iterator per row.
+
+    Only the row offsets are kept in memory; each iterator reads its row
+    `window` characters at a time on demand.
+
+    Args:
+        path: Path to the worksheet file
+        window: Number of characters to read per chunk
+
+    Returns:
+        One chunk iterator per row, suitable for stream_problems
+    """
+    bounds = []
+    offset = 0
+    start = 0
+    with open(path, "rb") as f:
+        while block := f.read(1 << 16):
+            newline = block.find(b"\n")
+            while newline != -1:
+                bounds.append((start, offset + newline))
+                start = offset + newline + 1
+                newline = block.find(b"\n", newline + 1)
+            offset += len(block)
+    if offset > start:
+        bounds.append((start, offset))
+
+    def chunks(start: int, end: int) -> Iterator[str]:
+        with open(path, "rb") as f:
+            f.seek(start)
+            while start < end:
+                chunk = f.read(min(window, end - start))
+                start += len(chunk)
+                yield chunk.decode().rstrip("\r")
+
+    return [chunks(start, end) for start, end in bounds]
+
+
+def solve_worksheet(path: str, vertical: bool = False, window: int = 4096) -> int:
+    """Stream a worksheet file and return the grand total.
+
+    Each problem is solved as soon as it has been read, so memory stays
+    proportional to the widest problem rather than the whole worksheet.
+
+    Args:
+        path: Path to the worksheet file
+        vertical: Read numbers column by column (part 2) instead of row by row
+        window: Number of characters to read per row at a time
+
+    Returns:
+        Sum of all problem answers
+    """
+    problems = stream_problems(row_chunks(path, window), vertical)
+    return sum(solve_problem(numbers, op) for numbers, op in problems)
+
+
 def run() -> None:
     """Run the day 6 solutions."""
     print("Day 6: Trash Compactor")
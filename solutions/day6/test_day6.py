@@ -1,11 +1,20 @@
 """Tests for Day 6: Trash Compactor."""
 
+import math
+from collections.abc import Iterator
+from pathlib import Path
+
 from solutions.day6.day6 import (
+    column_spans,
     parse_problems,
     parse_problems_vertical,
     part1,
     part2,
+    product_tree,
+    solve_all,
     solve_problem,
+    solve_worksheet,
+    stream_problems,
 )
 
 EXAMPLE_INPUT = """123 328  51 64
@@ -14,6 +23,23 @@ EXAMPLE_INPUT = """123 328  51 64
 *   +   *   +"""
 
 
+class TestColumnSpans:
+    """Tests for column_spans function."""
+
+    def test_example(self) -> None:
+        """Find one span per problem in the example."""
+        spans = list(column_spans(EXAMPLE_INPUT.split("\n")))
+        assert spans == [(0, 3), (4, 7), (8, 11), (12, 15)]
+
+    def test_ragged_lines(self) -> None:
+        """Shorter lines count as blank past their end."""
+        assert list(column_spans(["12  3", "4", "+  *"])) == [(0, 2), (3, 5)]
+
+    def test_empty(self) -> None:
+        """An empty worksheet has no spans."""
+        assert list(column_spans([""])) == []
+
+
 class TestParseProblems:
     """Tests for parse_problems function."""
 
@@ -44,6 +70,40 @@ class TestParseProblemsVertical:
         assert problems[3][1] == "+"
 
 
+def chunked(line: str, size: int) -> Iterator[str]:
+    """Split a line into chunks of the given size."""
+    for i in range(0, len(line), size):
+        yield line[i : i + size]
+
+
+class TestStreamProblems:
+    """Tests for stream_problems function."""
+
+    def test_matches_parse_problems(self) -> None:
+        """Streaming in small windows gives the same problems."""
+        for size in (1, 2, 5, 100):
+            rows = [chunked(line, size) for line in EXAMPLE_INPUT.split("\n")]
+            assert list(stream_problems(rows)) == parse_problems(EXAMPLE_INPUT)
+
+    def test_matches_parse_problems_vertical(self) -> None:
+        """Streaming vertically gives the same problems."""
+        for size in (1, 3, 7):
+            rows = [chunked(line, size) for line in EXAMPLE_INPUT.split("\n")]
+            expected = parse_problems_vertical(EXAMPLE_INPUT)
+            assert list(stream_problems(rows, vertical=True)) == expected
+
+
+class TestSolveWorksheet:
+    """Tests for solve_worksheet function."""
+
+    def test_example(self, tmp_path: Path) -> None:
+        """Streaming a worksheet file matches both parts."""
+        path = tmp_path / "input.txt"
+        path.write_text(EXAMPLE_INPUT + "\n")
+        assert solve_worksheet(str(path), window=2) == 4277556
+        assert solve_worksheet(str(path), vertical=True, window=2) == 3263827
+
+
 class TestSolveProblem:
     """Tests for solve_problem function."""
 
@@ -56,6 +116,28 @@ class TestSolveProblem:
         assert solve_problem([328, 64, 98], "+") == 490
 
 
+class TestProductTree:
+    """Tests for product_tree function."""
+
+    def test_matches_prod(self) -> None:
+        """Balanced product equals a left-to-right product."""
+        for n in (0, 1, 7, 8, 9, 33):
+            numbers = [10**k + k for k in range(n)]
+            assert product_tree(numbers) == math.prod(numbers)
+
+
+class TestSolveAll:
+    """Tests for solve_all function."""
+
+    def test_sequential(self) -> None:
+        """Solving in-process gives the part 1 total."""
+        assert solve_all(parse_problems(EXAMPLE_INPUT), workers=1) == 4277556
+
+    def test_process_pool(self) -> None:
+        """Solving across processes gives the same total."""
+        assert solve_all(parse_problems(EXAMPLE_INPUT), workers=2) == 4277556
+
+
 class TestPart1:
     """Tests for part1 function."""
 
@@ -1,8 +1,24 @@
 """Day 7: Laboratories - Advent of Code 2025."""
 
+import heapq
+from bisect import bisect_right
+
 from solutions.utils import get_input
 
 
+def parse_manifold(data: str) -> tuple[list[str], int]:
+    """Parse the manifold diagram into rows and the starting column.
+
+    Args:
+        data: The puzzle input (manifold diagram)
+
+    Returns:
+        Tuple of (rows, start column), with start column -1 if there is no S
+    """
+    lines = data.strip().split("\n")
+    return lines, lines[0].find("S")
+
+
 def simulate_beams(data: str) -> int:
     """Simulate tachyon beams and count the number of splits.
 
@@ -15,17 +31,10 @@ def simulate_beams(data: str) -> int:
     Returns:
         Number of times a beam is split
     """
-    lines = data.strip().split("\n")
+    lines, start_col = parse_manifold(data)
     rows = len(lines)
     cols = len(lines[0]) if rows > 0 else 0
 
-    # Find starting position (S)
-    start_col = -1
-    for col, char in enumerate(lines[0]):
-        if char == "S":
-            start_col = col
-            break
-
     if start_col == -1:
         return 0
 
@@ -63,6 +72,58 @@ def simulate_beams(data: str) -> int:
     return split_count
 
 
+def splitter_mask(line: str) -> int:
+    """Encode the splitter positions of a row as a bitmask.
+
+    Bit i is set when column i holds a splitter; every other character
+    (including a stray carriage return) is empty space.
+
+    Args:
+        line: One row of the manifold
+
+    Returns:
+        Bitmask of splitter columns
+    """
+    mask = 0
+    col = line.find("^")
+    while col != -1:
+        mask |= 1 << col
+        col = line.find("^", col + 1)
+    return mask
+
+
+def simulate_beams_bitboard(data: str) -> int:
+    """Count beam splits using big-integer bitmasks for beams and splitters.
+
+    Each row is a handful of shifts, ANDs and ORs over the whole row at once,
+    instead of a set update per active beam.
+
+    Args:
+        data: The puzzle input (manifold diagram)
+
+    Returns:
+        Number of times a beam is split
+    """
+    lines, start_col = parse_manifold(data)
+    if start_col == -1:
+        return 0
+
+    width = (1 << len(lines[0])) - 1
+    beams = 1 << start_col
+    split_count = 0
+
+    for line in lines[1:]:
+        splitters = splitter_mask(line)
+        hits = beams & splitters
+        if hits:
+            split_count += hits.bit_count()
+            beams = ((beams & ~splitters) | (hits << 1) | (hits >> 1)) & width
+        if not beams:
+            break
+
+    return split_count
+
+
 def part1(data: str) -> int:
     """Solve part 1 of the puzzle.
 
@@ -74,7 +135,7 @@ def part1(data: str) -> int:
     Returns:
         Number of beam splits
     """
-    return simulate_beams(data)
+    return simulate_beams_bitboard(data)
 
 
 def count_timelines(data: str) -> int:
@@ -89,17 +150,10 @@ def count_timelines(data: str) -> int:
     Returns:
         Total number of distinct timelines
     """
-    lines = data.strip().split("\n")
+    lines, start_col = parse_manifold(data)
     rows = len(lines)
     cols = len(lines[0]) if rows > 0 else 0
 
-    # Find starting position (S)
-    start_col = -1
-    for col, char in enumerate(lines[0]):
-        if char == "S":
-            start_col = col
-            break
-
     if start_col == -1:
         return 0
 
@@ -140,6 +194,254 @@ def count_timelines(data: str) -> int:
     return finished_timelines
 
 
+def splitter_rows(lines: list[str]) -> list[tuple[int, list[int]]]:
+    """Index the splitter columns of every row that contains a splitter.
+
+    Args:
+        lines: The manifold rows
+
+    Returns:
+        List of (row, splitter columns) for rows below the start, top to bottom
+    """
+    index = []
+    for row in range(1, len(lines)):
+        line = lines[row]
+        cols = []
+        col = line.find("^")
+        while col != -1:
+            cols.append(col)
+            col = line.find("^", col + 1)
+        if cols:
+            index.append((row, cols))
+    return index
+
+
+def count_timelines_dense(data: str) -> int:
+    """Count timelines with a dense per-column array, visiting only splitter rows.
+
+    Rows without splitters leave every count unchanged, so only the pre-indexed
+    splitter rows are processed. Python ints never overflow, so no fallback for
+    very large counts is needed.
+
+    Args:
+        data: The puzzle input (manifold diagram)
+
+    Returns:
+        Total number of distinct timelines
+    """
+    lines, start_col = parse_manifold(data)
+    if start_col == -1:
+        return 0
+
+    cols = len(lines[0])
+    counts = [0] * cols
+    counts[start_col] = 1
+
+    for _, splitters in splitter_rows(lines):
+        # Take every splitter's count before moving any, so timelines emitted
+        # onto a neighbouring splitter are not split again in the same row
+        moving = [(col, counts[col]) for col in splitters if counts[col]]
+        for col, _ in moving:
+            counts[col] = 0
+        for col, count in moving:
+            if col - 1 >= 0:
+                counts[col - 1] += count
+            if col + 1 < cols:
+                counts[col + 1] += count
+
+    return sum(counts)
+
+
+def splitter_columns(lines: list[str]) -> list[list[int]]:
+    """Index the splitter rows of every column.
+
+    Args:
+        lines: The manifold rows
+
+    Returns:
+        For each column, the sorted rows (below the start) holding a splitter
+    """
+    index: list[list[int]] = [[] for _ in range(len(lines[0]))]
+    for row, cols in splitter_rows(lines):
+        for col in cols:
+            index[col].append(row)
+    return index
+
+
+def next_splitter(index: list[list[int]], row: int, col: int) -> int | None:
+    """Find the first splitter strictly below a row in a column.
+
+    Args:
+        index: Splitter rows per column, from splitter_columns
+        row: Row the beam is currently in
+        col: Column the beam is moving down
+
+    Returns:
+        Row of the next splitter, or None if the beam leaves the bottom
+    """
+    rows = index[col]
+    i = bisect_right(rows, row)
+    return rows[i] if i < len(rows) else None
+
+
+def simulate_beams_events(data: str) -> int:
+    """Count beam splits by jumping each beam straight to its next splitter.
+
+    Merged beams share the same splitters, so the answer is the number of
+    distinct splitters reached. Cost scales with splitter hits, not rows.
+
+    Args:
+        data: The puzzle input (manifold diagram)
+
+    Returns:
+        Number of times a beam is split
+    """
+    lines, start_col = parse_manifold(data)
+    if start_col == -1:
+        return 0
+
+    index = splitter_columns(lines)
+    cols = len(index)
+    hit: set[tuple[int, int]] = set()
+    stack = [(0, start_col)]
+
+    while stack:
+        row, col = stack.pop()
+        splitter = next_splitter(index, row, col)
+        if splitter is None or (splitter, col) in hit:
+            continue
+        hit.add((splitter, col))
+        if col - 1 >= 0:
+            stack.append((splitter, col - 1))
+        if col + 1 < cols:
+            stack.append((splitter, col + 1))
+
+    return len(hit)
+
+
+def count_timelines_events(data: str) -> int:
+    """Count timelines by processing splitter hits in row order.
+
+    Timelines arriving at the same splitter are merged before it is
+    processed, and timelines with no splitter below them finish immediately.
+
+    Args:
+        data: The puzzle input (manifold diagram)
+
+    Returns:
+        Total number of distinct timelines
+    """
+    lines, start_col = parse_manifold(data)
+    if start_col == -1:
+        return 0
+
+    index = splitter_columns(lines)
+    cols = len(index)
+    finished = 0
+    pending: dict[tuple[int, int], int] = {}
+    events: list[tuple[int, int]] = []
+
+    def arrive(row: int, col: int, count: int) -> None:
+        nonlocal finished
+        splitter = next_splitter(index, row, col)
+        if splitter is None:
+            finished += count
+        elif (splitter, col) in pending:
+            pending[splitter, col] += count
+        else:
+            pending[splitter, col] = count
+            heapq.heappush(events, (splitter, col))
+
+    arrive(0, start_col, 1)
+    while events:
+        row, col = heapq.heappop(events)
+        count = pending.pop((row, col))
+        if col - 1 >= 0:
+            arrive(row, col - 1, count)
+        if col + 1 < cols:
+            arrive(row, col + 1, count)
+
+    return finished
+
+
+class Manifold:
+    """Answer beam queries for any start column after one bottom-up pass.
+
+    Every splitter stores the number of timelines leaving it and a bitmask of
+    the splitters reachable from it (itself included). Each start column then
+    resolves to its first splitter, so single-start queries are O(1) lookups.
+    Timelines from several starts add up; split counts OR the reach masks so
+    splitters shared between starts are only counted once.
+    """
+
+    def __init__(self, data: str) -> None:
+        """Build the per-splitter and per-start tables.
+
+        Args:
+            data: The puzzle input (manifold diagram)
+        """
+        lines, self.start_col = parse_manifold(data)
+        index = splitter_columns(lines)
+        self.cols = len(index)
+
+        splitters = sorted(
+            ((row, col) for col, rows in enumerate(index) for row in rows), reverse=True
+        )
+        timelines: dict[tuple[int, int], int] = {}
+        reach: dict[tuple[int, int], int] = {}
+
+        # Bottom-up: every child splitter is in a lower row and already done
+        for bit, (row, col) in enumerate(splitters):
+            count = 0
+            mask = 1 << bit
+            for child in (col - 1, col + 1):
+                if 0 <= child < self.cols:
+                    below = next_splitter(index, row, child)
+                    if below is None:
+                        count += 1
+                    else:
+                        count += timelines[below, child]
+                        mask |= reach[below, child]
+            timelines[row, col] = count
+            reach[row, col] = mask
+
+        self._timelines = [1] * self.cols
+        self._reach = [0] * self.cols
+        for col in range(self.cols):
+            first = next_splitter(index, 0, col)
+            if first is not None:
+                self._timelines[col] = timelines[first, col]
+                self._reach[col] = reach[first, col]
+
+    def timelines(self, *cols: int) -> int:
+        """Count timelines for beams entering at the given columns.
+
+        Args:
+            cols: Start columns (defaults to the S column)
+
+        Returns:
+            Total number of timelines over all starts
+        """
+        cols = cols or (self.start_col,)
+        return sum(self._timelines[col] for col in cols if 0 <= col < self.cols)
+
+    def splits(self, *cols: int) -> int:
+        """Count distinct splits for beams entering at the given columns.
+
+        Args:
+            cols: Start columns (defaults to the S column)
+
+        Returns:
+            Number of distinct splitters hit by any of the beams
+        """
+        cols = cols or (self.start_col,)
+        mask = 0
+        for col in cols:
+            if 0 <= col < self.cols:
+                mask |= self._reach[col]
+        return mask.bit_count()
+
+
 def part2(data: str) -> int:
     """Solve part 2 of the puzzle.
 
@@ -151,7 +453,7 @@ def part2(data: str) -> int:
     Returns:
         Number of timelines
     """
-    return count_timelines(data)
+    return count_timelines_dense(data)
 
 
 def run() -> None:
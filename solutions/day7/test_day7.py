@@ -1,6 +1,20 @@
 """Tests for Day 7: Laboratories."""
 
-from solutions.day7.day7 import count_timelines, part1, part2, simulate_beams
+from solutions.day7.day7 import (
+    Manifold,
+    count_timelines,
+    count_timelines_dense,
+    count_timelines_events,
+    next_splitter,
+    part1,
+    part2,
+    simulate_beams,
+    simulate_beams_bitboard,
+    simulate_beams_events,
+    splitter_columns,
+    splitter_mask,
+    splitter_rows,
+)
 
 EXAMPLE_INPUT = """.......S.......
 ...............
@@ -46,6 +60,37 @@ class TestSimulateBeams:
         assert simulate_beams(data) == 3  # 1 split at first ^, 2 splits at bottom ^s
 
 
+class TestSplitterMask:
+    """Tests for splitter_mask function."""
+
+    def test_bits_match_columns(self) -> None:
+        """Bit i is set for a splitter in column i."""
+        assert splitter_mask("^..^.") == 0b01001
+        assert splitter_mask(".....") == 0
+
+    def test_other_characters_are_empty(self) -> None:
+        """Characters other than splitters, such as a CRLF tail, are empty."""
+        assert splitter_mask("^.S|^\r") == 0b10001
+        assert simulate_beams_bitboard(".S.\r\n.^.\r") == simulate_beams(".S.\r\n.^.\r")
+
+
+class TestSimulateBeamsBitboard:
+    """Tests for simulate_beams_bitboard function."""
+
+    def test_matches_simulate_beams(self) -> None:
+        """Bitboard simulation agrees with the set-based simulation."""
+        for data in (EXAMPLE_INPUT, "S\n^", "S\n.\n.", ".S.\n...\n.^.\n...\n^.^"):
+            assert simulate_beams_bitboard(data) == simulate_beams(data)
+
+    def test_edge_splitter(self) -> None:
+        """Beams split off the grid edge are discarded."""
+        data = """S.
+^.
+.^
+^."""
+        assert simulate_beams_bitboard(data) == simulate_beams(data) == 3
+
+
 class TestPart1:
     """Tests for part1 function."""
 
@@ -80,6 +125,105 @@ class TestCountTimelines:
         assert count_timelines(data) == 4  # 1 -> 2 -> 4
 
 
+class TestSplitterRows:
+    """Tests for splitter_rows function."""
+
+    def test_skips_empty_rows(self) -> None:
+        """Only rows containing splitters are indexed."""
+        assert splitter_rows(["..S..", ".....", "^...^", ".....", "..^.."]) == [
+            (2, [0, 4]),
+            (4, [2]),
+        ]
+
+
+class TestCountTimelinesDense:
+    """Tests for count_timelines_dense function."""
+
+    def test_matches_count_timelines(self) -> None:
+        """Dense DP agrees with the dict-based count."""
+        for data in (EXAMPLE_INPUT, "S\n.\n.", ".S.\n.^.", "..S..\n.....\n..^..\n.....\n.^.^."):
+            assert count_timelines_dense(data) == count_timelines(data)
+
+    def test_adjacent_splitters(self) -> None:
+        """Timelines emitted onto a neighbouring splitter continue to the next row."""
+        data = """..S..
+..^^.
+....."""
+        assert count_timelines_dense(data) == count_timelines(data) == 2
+
+    def test_tall_empty_manifold(self) -> None:
+        """Rows without splitters do not change the count."""
+        data = "\n".join([".S.", *["..."] * 10000, ".^."])
+        assert count_timelines_dense(data) == 2
+
+
+class TestSplitterColumns:
+    """Tests for splitter_columns and next_splitter functions."""
+
+    def test_index(self) -> None:
+        """Each column lists its splitter rows in order."""
+        index = splitter_columns([".S.", "^..", "..^", "^.."])
+        assert index == [[1, 3], [], [2]]
+        assert next_splitter(index, 0, 0) == 1
+        assert next_splitter(index, 1, 0) == 3
+        assert next_splitter(index, 3, 0) is None
+        assert next_splitter(index, 0, 1) is None
+
+
+class TestEventSimulation:
+    """Tests for the event-driven simulations."""
+
+    CASES = (
+        EXAMPLE_INPUT,
+        "S\n^",
+        "S\n.\n.",
+        ".S.\n...\n.^.\n...\n^.^",
+        "S.\n^.\n.^\n^.",
+        "..S..\n..^^.\n.....",
+    )
+
+    def test_simulate_beams_events(self) -> None:
+        """Event-driven split count agrees with the row simulation."""
+        for data in self.CASES:
+            assert simulate_beams_events(data) == simulate_beams(data)
+
+    def test_count_timelines_events(self) -> None:
+        """Event-driven timeline count agrees with the row DP."""
+        for data in self.CASES:
+            assert count_timelines_events(data) == count_timelines(data)
+
+
+class TestManifold:
+    """Tests for the Manifold query class."""
+
+    def test_default_start(self) -> None:
+        """Without columns, queries start from S."""
+        manifold = Manifold(EXAMPLE_INPUT)
+        assert manifold.splits() == 21
+        assert manifold.timelines() == 40
+
+    def test_every_start_column(self) -> None:
+        """Each start column matches a fresh simulation from that column."""
+        manifold = Manifold(EXAMPLE_INPUT)
+        rows = EXAMPLE_INPUT.replace("S", ".").split("\n")
+        for col in range(len(rows[0])):
+            data = "\n".join([rows[0][:col] + "S" + rows[0][col + 1 :], *rows[1:]])
+            assert manifold.splits(col) == simulate_beams(data)
+            assert manifold.timelines(col) == count_timelines(data)
+
+    def test_multiple_starts(self) -> None:
+        """Timelines add up across starts while shared splits count once."""
+        manifold = Manifold(EXAMPLE_INPUT)
+        assert manifold.timelines(7, 7) == 80
+        assert manifold.splits(7, 7) == 21
+        assert manifold.splits(0, 7) == 21
+
+    def test_out_of_range_start(self) -> None:
+        """Columns outside the manifold contribute nothing."""
+        manifold = Manifold(EXAMPLE_INPUT)
+        assert manifold.timelines(-1, 99) == 0
+
+
 class TestPart2:
     """Tests for part2 function."""
 
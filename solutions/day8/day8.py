@@ -1,7 +1,13 @@
 """Day 8: Playground - Advent of Code 2025."""
 
+import heapq
 import math
-from collections.abc import Iterator
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
+from multiprocessing.shared_memory import SharedMemory
 
 from solutions.utils import get_input
 
@@ -32,45 +38,346 @@ def distance(p1: tuple[int, int, int], p2: tuple[int, int, int]) -> float:
     Returns:
         Straight-line distance
     """
-    return math.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2 + (p1[2] - p2[2]) ** 2)
+    return math.sqrt(squared_distance(p1, p2))
+
+
+def squared_distance(p1: tuple[int, int, int], p2: tuple[int, int, int]) -> int:
+    """Calculate the exact squared Euclidean distance between two 3D points.
+
+    Ordering by squared distance is the same as ordering by distance, without
+    float rounding or spurious ties.
+
+    Args:
+        p1: First point (x, y, z)
+        p2: Second point (x, y, z)
+
+    Returns:
+        Squared straight-line distance
+    """
+    return (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2 + (p1[2] - p2[2]) ** 2
 
 
 def all_pairs_by_distance(
     positions: list[tuple[int, int, int]],
-) -> Iterator[tuple[float, int, int]]:
+) -> Iterator[tuple[int, int, int]]:
     """Generate all pairs of positions sorted by distance.
 
     Args:
         positions: List of positions
 
     Yields:
-        Tuples of (distance, index1, index2) sorted by distance
+        Tuples of (squared distance, index1, index2) sorted by distance
     """
     pairs = []
     n = len(positions)
     for i in range(n):
         for j in range(i + 1, n):
-            d = distance(positions[i], positions[j])
+            d = squared_distance(positions[i], positions[j])
             pairs.append((d, i, j))
     pairs.sort()
     yield from pairs
 
 
+def closest_pairs(
+    positions: list[tuple[int, int, int]], k: int, block: int = 64
+) -> list[tuple[int, int, int]]:
+    """Select the k closest pairs exhaustively with bounded memory.
+
+    Pairs are generated lazily in blocks of `block` first indices and merged
+    into the running k smallest, so only O(k) pairs are held at any time
+    instead of sorting all n² of them.
+
+    Args:
+        positions: List of positions
+        k: Number of pairs to select
+        block: Number of first indices per block
+
+    Returns:
+        The k closest (squared distance, index1, index2) pairs, sorted
+    """
+    n = len(positions)
+    best: list[tuple[int, int, int]] = []
+    for start in range(0, n, block):
+        chunk = (
+            (squared_distance(positions[i], positions[j]), i, j)
+            for i in range(start, min(start + block, n))
+            for j in range(i + 1, n)
+        )
+        best = heapq.nsmallest(k, chain(best, chunk))
+    return best
+
+
+# Coordinates shared with pool workers, set by _attach_coordinates
+_shared_memory: SharedMemory | None = None
+_shared_coords: memoryview | None = None
+
+
+def _attach_coordinates(name: str) -> None:
+    """Attach a pool worker to the shared coordinate array."""
+    global _shared_memory, _shared_coords
+    _shared_memory = SharedMemory(name=name)
+    assert _shared_memory.buf is not None
+    _shared_coords = _shared_memory.buf.cast("q")
+
+
+def _tile_closest_pairs(tile: tuple[int, int, int, int], k: int) -> list[tuple[int, int, int]]:
+    """Select the k closest pairs within one tile of the pair space.
+
+    Args:
+        tile: Row range start and end, column range start and end
+        k: Number of pairs to select
+
+    Returns:
+        The tile's k closest (squared distance, index1, index2) pairs
+    """
+    assert _shared_coords is not None
+    c = _shared_coords
+    i0, i1, j0, j1 = tile
+    rows = [(c[3 * i], c[3 * i + 1], c[3 * i + 2]) for i in range(i0, i1)]
+    cols = [(c[3 * j], c[3 * j + 1], c[3 * j + 2]) for j in range(j0, j1)]
+    pairs = (
+        (squared_distance(rows[i - i0], cols[j - j0]), i, j)
+        for i in range(i0, i1)
+        for j in range(max(j0, i + 1), j1)
+    )
+    return heapq.nsmallest(k, pairs)
+
+
+def closest_pairs_parallel(
+    positions: list[tuple[int, int, int]], k: int, workers: int | None = None, tile: int = 256
+) -> list[tuple[int, int, int]]:
+    """Select the k closest pairs exhaustively across a process pool.
+
+    The n x n pair space is cut into square tiles on or above the diagonal.
+    Coordinates are placed once in shared memory, so tasks only carry tile
+    bounds, and each worker returns just its tile's k smallest pairs.
+
+    Args:
+        positions: List of positions
+        k: Number of pairs to select
+        workers: Number of worker processes (None for one per CPU)
+        tile: Tile edge length in points
+
+    Returns:
+        The k closest (squared distance, index1, index2) pairs, sorted
+    """
+    n = len(positions)
+    coords = array("q", (v for p in positions for v in p))
+    shm = SharedMemory(create=True, size=max(coords.itemsize * len(coords), 1))
+    try:
+        assert shm.buf is not None
+        shm.buf[: len(coords) * coords.itemsize] = coords.tobytes()
+        tiles = [
+            (a, min(a + tile, n), b, min(b + tile, n))
+            for a in range(0, n, tile)
+            for b in range(a, n, tile)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_attach_coordinates, initargs=(shm.name,)
+        ) as executor:
+            results = executor.map(_tile_closest_pairs, tiles, repeat(k))
+            return heapq.nsmallest(k, chain.from_iterable(results))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+class GridIndex:
+    """Uniform-grid spatial index over 3D integer points.
+
+    Points are bucketed into cubic cells. Cells at Chebyshev distance exactly
+    r from a point's own cell form its r-th shell, and every point outside
+    shells 0..r is at least r * cell away.
+    """
+
+    def __init__(self, positions: list[tuple[int, int, int]], cell: int | None = None) -> None:
+        """Bucket the positions into grid cells.
+
+        Args:
+            positions: List of positions
+            cell: Cell edge length (defaults to roughly one point per cell)
+        """
+        if cell is None:
+            # Size cells from the axes the points actually spread along, so
+            # flat or collinear inputs still get about one point per cell
+            volume = 1
+            dims = 0
+            for axis in range(3):
+                coords = [p[axis] for p in positions]
+                extent = max(coords, default=0) - min(coords, default=0) + 1
+                if extent > 1:
+                    volume *= extent
+                    dims += 1
+            cell = max(1, round((volume / max(len(positions), 1)) ** (1 / max(dims, 1))))
+        self.cell = cell
+        self.cells: defaultdict[tuple[int, int, int], list[int]] = defaultdict(list)
+        self.lo = [0, 0, 0]
+        self.hi = [-1, -1, -1]
+        for i, p in enumerate(positions):
+            self.add(i, p)
+
+    def cell_of(self, p: tuple[int, int, int]) -> tuple[int, int, int]:
+        """Get the cell containing a point."""
+        return p[0] // self.cell, p[1] // self.cell, p[2] // self.cell
+
+    def add(self, i: int, p: tuple[int, int, int]) -> None:
+        """Insert point i into its cell and grow the occupied bounds.
+
+        Args:
+            i: Index of the point
+            p: Position of the point
+        """
+        c = self.cell_of(p)
+        first = not self.cells
+        self.cells[c].append(i)
+        for axis in range(3):
+            if first or c[axis] < self.lo[axis]:
+                self.lo[axis] = c[axis]
+            if first or c[axis] > self.hi[axis]:
+                self.hi[axis] = c[axis]
+
+    def max_radius(self, p: tuple[int, int, int]) -> int:
+        """Get the shell radius beyond which no occupied cell remains."""
+        c = self.cell_of(p)
+        return max(max(c[axis] - self.lo[axis], self.hi[axis] - c[axis]) for axis in range(3))
+
+    def near(self, p: tuple[int, int, int], radius: float) -> Iterator[int]:
+        """Yield the indices of all points that may lie within a radius of a point.
+
+        Every point within the radius is yielded, along with some further
+        away, so callers still filter by exact distance. Large radii scan the
+        occupied cells directly instead of enumerating empty ones.
+
+        Args:
+            p: Center point
+            radius: Search radius
+
+        Yields:
+            Candidate point indices
+        """
+        r = self.max_radius(p)
+        if radius < r * self.cell:
+            r = int(radius // self.cell) + 1
+        if (2 * r + 1) ** 3 > len(self.cells):
+            yield from self._scan(p, 0, r)
+        else:
+            for shell in range(r + 1):
+                yield from self.shell(p, shell)
+
+    def shell(self, p: tuple[int, int, int], r: int) -> Iterator[int]:
+        """Yield the indices of points in the r-th shell around a point's cell.
+
+        Args:
+            p: Center point
+            r: Chebyshev radius in cells
+
+        Yields:
+            Indices of the points in that shell
+        """
+        if (2 * r + 1) ** 3 - max(2 * r - 1, 0) ** 3 > len(self.cells):
+            yield from self._scan(p, r, r)
+            return
+        cx, cy, cz = self.cell_of(p)
+        full = range(-r, r + 1)
+        faces = (-r, r) if r else (0,)
+        for dx in full:
+            for dy in full:
+                for dz in full if abs(dx) == r or abs(dy) == r else faces:
+                    bucket = self.cells.get((cx + dx, cy + dy, cz + dz))
+                    if bucket:
+                        yield from bucket
+
+    def _scan(self, p: tuple[int, int, int], inner: int, outer: int) -> Iterator[int]:
+        """Yield points in occupied cells at Chebyshev radius inner..outer from p's cell.
+
+        Used instead of walking shells when they have more cells than are
+        occupied.
+        """
+        cx, cy, cz = self.cell_of(p)
+        for (x, y, z), bucket in self.cells.items():
+            if inner <= max(abs(x - cx), abs(y - cy), abs(z - cz)) <= outer:
+                yield from bucket
+
+
+def nearest_pairs(
+    positions: list[tuple[int, int, int]],
+) -> Iterator[tuple[int, int, int]]:
+    """Lazily generate pairs of positions in increasing distance.
+
+    Every point keeps a cursor over its neighbours with a higher index, filled
+    one grid shell at a time. A global heap holds, per cursor, either its next
+    pair or a lower bound on anything it has not scanned yet, so shells are only
+    expanded when that bound is the smallest distance left. Taking the first k
+    pairs costs roughly O((n + k) log n) instead of sorting all n² pairs.
+
+    Args:
+        positions: List of positions
+
+    Yields:
+        Tuples of (squared distance, index1, index2) sorted by distance
+    """
+    n = len(positions)
+    grid = GridIndex(positions)
+    cell = grid.cell
+    radius = [-1] * n
+    last = [grid.max_radius(p) for p in positions]
+    local: list[list[tuple[int, int]]] = [[] for _ in range(n)]
+    # Entries are (squared distance, i, j), with j == -1 marking a lower bound
+    heap = [(0, i, -1) for i in range(n)]
+    heapq.heapify(heap)
+
+    def advance(i: int) -> None:
+        candidates = local[i]
+        exhausted = radius[i] >= last[i]
+        bound = (radius[i] * cell) ** 2
+        if candidates and (exhausted or candidates[0][0] <= bound):
+            heapq.heappush(heap, (candidates[0][0], i, candidates[0][1]))
+        elif not exhausted:
+            heapq.heappush(heap, (bound, i, -1))
+
+    while heap:
+        d2, i, j = heapq.heappop(heap)
+        if j == -1:
+            radius[i] += 1
+            p = positions[i]
+            for k in grid.shell(p, radius[i]):
+                if k > i:
+                    heapq.heappush(local[i], (squared_distance(p, positions[k]), k))
+        else:
+            heapq.heappop(local[i])
+            yield d2, i, j
+        advance(i)
+
+
 class UnionFind:
-    """Union-Find data structure for tracking connected components."""
+    """Union-Find data structure for tracking connected components.
+
+    Parents and sizes live in flat int arrays, find uses iterative path
+    halving, and the sizes of the `track` largest components are kept up to
+    date on every union so they can be read without scanning all elements.
+    """
+
+    __slots__ = ("components", "count", "largest", "parent", "size", "track")
 
-    def __init__(self, n: int) -> None:
+    def __init__(self, n: int, track: int = 3) -> None:
         """Initialize with n separate components.
 
         Args:
             n: Number of elements
+            track: Number of largest component sizes to keep track of
         """
-        self.parent = list(range(n))
-        self.rank = [0] * n
-        self.size = [1] * n
+        self.parent = array("i", range(n))
+        self.size = array("i", [1] * n)
+        self.components = n
+        self.track = track
+        # Number of components of each size, indexed by size
+        self.count = array("i", [0] * (n + 1))
+        if n:
+            self.count[1] = n
+        self.largest = [1] * min(track, n)
 
     def find(self, x: int) -> int:
-        """Find the root of element x with path compression.
+        """Find the root of element x with path halving.
 
         Args:
             x: Element to find
@@ -78,9 +385,11 @@ class UnionFind:
         Returns:
             Root of the component containing x
         """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x: int, y: int) -> bool:
         """Union two elements.
@@ -96,47 +405,92 @@ class UnionFind:
         if px == py:
             return False
 
-        # Union by rank
-        if self.rank[px] < self.rank[py]:
+        # Union by size
+        size = self.size
+        if size[px] < size[py]:
             px, py = py, px
         self.parent[py] = px
-        self.size[px] += self.size[py]
-        if self.rank[px] == self.rank[py]:
-            self.rank[px] += 1
+        self.components -= 1
+        self._resize(size[px], size[py])
+        size[px] += size[py]
         return True
 
+    def union_many(self, pairs: Iterable[tuple[int, int]]) -> int:
+        """Union every pair of elements.
+
+        Args:
+            pairs: Pairs of elements to connect
+
+        Returns:
+            Number of unions that merged two components
+        """
+        union = self.union
+        return sum(union(x, y) for x, y in pairs)
+
+    def _resize(self, a: int, b: int) -> None:
+        """Record two components of sizes a and b merging into one.
+
+        The tracked sizes only need a histogram scan when a tracked component
+        is absorbed and nothing larger replaces it.
+        """
+        count = self.count
+        count[a] -= 1
+        count[b] -= 1
+        count[a + b] += 1
+
+        top = self.largest
+        for old in (a, b):
+            if old in top:
+                top.remove(old)
+        top.append(a + b)
+        top.sort(reverse=True)
+
+        # Refill from the largest sizes not already tracked
+        size = top[-1] if len(top) < self.track else 0
+        while len(top) < min(self.track, self.components) and size > 0:
+            spare = count[size] - top.count(size)
+            top.extend([size] * min(spare, self.track - len(top)))
+            size -= 1
+        del top[self.track :]
+
     def get_component_sizes(self) -> list[int]:
         """Get sizes of all components.
 
         Returns:
             List of component sizes, sorted descending
         """
-        sizes = []
-        for i in range(len(self.parent)):
-            if self.find(i) == i:
-                sizes.append(self.size[i])
+        sizes = [self.size[i] for i, p in enumerate(self.parent) if i == p]
         return sorted(sizes, reverse=True)
 
 
-def connect_closest_pairs(positions: list[tuple[int, int, int]], num_connections: int) -> list[int]:
-    """Connect the closest pairs of junction boxes.
+def connect_circuits(positions: list[tuple[int, int, int]], num_connections: int) -> UnionFind:
+    """Connect the closest pairs of junction boxes into circuits.
 
     Args:
         positions: List of junction box positions
         num_connections: Number of connection attempts to make
 
     Returns:
-        List of component sizes after making connections
+        Union-find over the junction boxes after making connections
     """
     uf = UnionFind(len(positions))
+    # Try to connect even if already in same circuit
+    pairs = islice(nearest_pairs(positions), num_connections)
+    uf.union_many((i, j) for _, i, j in pairs)
+    return uf
 
-    for connections_attempted, (_, i, j) in enumerate(all_pairs_by_distance(positions)):
-        # Try to connect even if already in same circuit
-        uf.union(i, j)
-        if connections_attempted + 1 >= num_connections:
-            break
 
-    return uf.get_component_sizes()
+def connect_closest_pairs(positions: list[tuple[int, int, int]], num_connections: int) -> list[int]:
+    """Connect the closest pairs of junction boxes.
+
+    Args:
+        positions: List of junction box positions
+        num_connections: Number of connection attempts to make
+
+    Returns:
+        List of component sizes after making connections
+    """
+    return connect_circuits(positions, num_connections).get_component_sizes()
 
 
 def part1(data: str, num_connections: int = 1000) -> int:
@@ -152,33 +506,192 @@ def part1(data: str, num_connections: int = 1000) -> int:
         Product of three largest circuit sizes
     """
     positions = parse_positions(data)
-    sizes = connect_closest_pairs(positions, num_connections)
+    sizes = connect_circuits(positions, num_connections).largest
     return sizes[0] * sizes[1] * sizes[2]
 
 
+def minimum_spanning_tree(
+    positions: list[tuple[int, int, int]],
+) -> list[tuple[int, int, int]]:
+    """Build the Euclidean minimum spanning tree with dense Prim's algorithm.
+
+    Each step scans the points outside the tree once, keeping only the best
+    known connection per point, so memory is O(n) while time is O(n²).
+    Connections are compared by (squared distance, index1, index2), so ties
+    resolve to the same unique tree as Kruskal over the sorted pairs.
+
+    Args:
+        positions: List of positions
+
+    Returns:
+        MST edges as (squared distance, index1, index2) with index1 < index2,
+        sorted by distance
+    """
+    n = len(positions)
+    if n < 2:
+        return []
+
+    # Best known (squared distance, index1, index2) edge into the tree per point
+    best: list[tuple[float, int, int]] = [(math.inf, n, n)] * n
+    remaining = list(range(1, n))
+    edges = []
+    u = 0
+
+    while remaining:
+        ux, uy, uz = positions[u]
+        nearest = 0
+        for k, v in enumerate(remaining):
+            vx, vy, vz = positions[v]
+            d2 = (ux - vx) ** 2 + (uy - vy) ** 2 + (uz - vz) ** 2
+            edge = (d2, u, v) if u < v else (d2, v, u)
+            if edge < best[v]:
+                best[v] = edge
+            if best[v] < best[remaining[nearest]]:
+                nearest = k
+
+        # Swap-remove the closest point and add its edge to the tree
+        u = remaining[nearest]
+        remaining[nearest] = remaining[-1]
+        remaining.pop()
+        length, i, j = best[u]
+        edges.append((int(length), i, j))
+
+    return sorted(edges)
+
+
 def find_final_connection(
     positions: list[tuple[int, int, int]],
 ) -> tuple[tuple[int, int, int], tuple[int, int, int]]:
     """Find the connection that unifies all junction boxes into one circuit.
 
+    Connecting pairs in order of distance merges circuits exactly along the
+    minimum spanning tree, so the final merge is its longest edge.
+
     Args:
         positions: List of junction box positions
 
     Returns:
         Tuple of the two positions that form the final connection
     """
-    n = len(positions)
-    uf = UnionFind(n)
-    num_components = n
+    edges = minimum_spanning_tree(positions)
+    if not edges:
+        return positions[0], positions[0]
+
+    _, i, j = edges[-1]
+    return positions[i], positions[j]
+
 
-    for _, i, j in all_pairs_by_distance(positions):
-        if uf.union(i, j):
-            num_components -= 1
-            if num_components == 1:
-                return positions[i], positions[j]
+class Circuits:
+    """Junction box circuits maintained incrementally as boxes are added.
 
-    # Should not reach here if there are at least 2 positions
-    return positions[0], positions[0]
+    The model keeps the minimum spanning tree under the strict (squared
+    distance, index1, index2) edge order, plus the `num_connections` closest
+    pairs seen so far. A new box can only join the tree through one of its own
+    edges no longer than the current longest tree edge or its nearest
+    neighbour, and can only enter the closest pairs below the current cutoff,
+    so both are found with grid range queries rather than a full recompute.
+    """
+
+    def __init__(self, num_connections: int = 1000, cell: int = 1000) -> None:
+        """Create an empty set of junction boxes.
+
+        Args:
+            num_connections: Number of closest connections that form circuits
+            cell: Grid cell edge length for the spatial index
+        """
+        self.num_connections = num_connections
+        self.positions: list[tuple[int, int, int]] = []
+        self.grid = GridIndex([], cell)
+        self.tree: list[tuple[int, int, int]] = []
+        # Max-heap (negated keys) of the closest pairs seen so far
+        self._closest: list[tuple[int, int, int]] = []
+
+    def add_point(self, p: tuple[int, int, int]) -> None:
+        """Add a junction box and update the tree and closest pairs.
+
+        Args:
+            p: Position of the new junction box
+        """
+        new = len(self.positions)
+        if new:
+            cutoff = self._cutoff()
+            reach = max(self.tree[-1][0] if self.tree else 0, self._nearest(p))
+            radius = max(reach, cutoff if cutoff is not None else math.inf)
+            edges = []
+            for j in self.grid.near(p, math.sqrt(radius)):
+                d2 = squared_distance(p, self.positions[j])
+                if d2 <= reach:
+                    edges.append((d2, j, new))
+                if cutoff is None or d2 <= cutoff:
+                    self._offer((d2, j, new))
+            self._update_tree(new + 1, sorted(edges))
+
+        self.positions.append(p)
+        self.grid.add(new, p)
+
+    def _cutoff(self) -> int | None:
+        """Get the squared distance a new pair must beat, if the pair set is full."""
+        if len(self._closest) < self.num_connections or not self._closest:
+            return None
+        return -self._closest[0][0]
+
+    def _offer(self, pair: tuple[int, int, int]) -> None:
+        """Keep a pair if it is among the closest num_connections pairs."""
+        if self.num_connections <= 0:
+            return
+        d2, i, j = pair
+        if len(self._closest) < self.num_connections:
+            heapq.heappush(self._closest, (-d2, -i, -j))
+        elif pair < (-self._closest[0][0], -self._closest[0][1], -self._closest[0][2]):
+            heapq.heapreplace(self._closest, (-d2, -i, -j))
+
+    def _nearest(self, p: tuple[int, int, int]) -> int:
+        """Get the squared distance from p to its nearest existing junction box."""
+        radius = self.grid.cell
+        while True:
+            best = min(
+                (squared_distance(p, self.positions[j]) for j in self.grid.near(p, radius)),
+                default=None,
+            )
+            exhausted = radius >= self.grid.max_radius(p) * self.grid.cell
+            if best is not None and (best <= radius**2 or exhausted):
+                return best
+            radius *= 2
+
+    def _update_tree(self, n: int, edges: list[tuple[int, int, int]]) -> None:
+        """Rebuild the tree with Kruskal over the old tree plus new candidate edges."""
+        uf = UnionFind(n, track=0)
+        self.tree = [edge for edge in heapq.merge(self.tree, edges) if uf.union(edge[1], edge[2])]
+
+    def final_connection(self) -> tuple[tuple[int, int, int], tuple[int, int, int]] | None:
+        """Get the connection that unifies all junction boxes into one circuit.
+
+        Returns:
+            The two positions of the longest tree edge, or None for fewer than two boxes
+        """
+        if not self.tree:
+            return None
+        _, i, j = self.tree[-1]
+        return self.positions[i], self.positions[j]
+
+    def largest_circuits(self, count: int = 3) -> list[int]:
+        """Get the largest circuit sizes after the closest connections.
+
+        Connecting the closest pairs merges circuits exactly along the tree
+        edges that are among those pairs, so only tree edges are replayed.
+
+        Args:
+            count: Number of sizes to return
+
+        Returns:
+            The largest circuit sizes, descending
+        """
+        uf = UnionFind(len(self.positions), track=count)
+        if self._closest:
+            d2, i, j = self._closest[0]
+            last = (-d2, -i, -j)
+            uf.union_many((edge[1], edge[2]) for edge in self.tree if edge <= last)
+        return uf.largest
 
 
 def part2(data: str) -> int:
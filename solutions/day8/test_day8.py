@@ -1,12 +1,23 @@
 """Tests for Day 8: Playground."""
 
+import itertools
+
 from solutions.day8.day8 import (
+    Circuits,
+    GridIndex,
+    UnionFind,
+    all_pairs_by_distance,
+    closest_pairs,
+    closest_pairs_parallel,
     connect_closest_pairs,
     distance,
     find_final_connection,
+    minimum_spanning_tree,
+    nearest_pairs,
     parse_positions,
     part1,
     part2,
+    squared_distance,
 )
 
 EXAMPLE_INPUT = """162,817,812
@@ -55,6 +66,123 @@ class TestDistance:
         assert distance((0, 0, 0), (3, 4, 0)) == 5.0
 
 
+class TestSquaredDistance:
+    """Tests for squared_distance function."""
+
+    def test_exact(self) -> None:
+        """Squared distance is an exact integer."""
+        assert squared_distance((0, 0, 0), (3, 4, 0)) == 25
+        assert squared_distance((1, 2, 3), (1, 2, 3)) == 0
+
+
+class TestClosestPairs:
+    """Tests for closest_pairs function."""
+
+    def test_matches_sorted_pairs(self) -> None:
+        """Top-k selection equals the head of the full sort for any block size."""
+        positions = parse_positions(EXAMPLE_INPUT)
+        full = list(all_pairs_by_distance(positions))
+        for block in (1, 3, 64):
+            assert closest_pairs(positions, 10, block) == full[:10]
+
+    def test_k_larger_than_pairs(self) -> None:
+        """Asking for more pairs than exist returns them all."""
+        positions = [(0, 0, 0), (1, 0, 0), (5, 0, 0)]
+        assert closest_pairs(positions, 10) == [(1, 0, 1), (16, 1, 2), (25, 0, 2)]
+
+
+class TestClosestPairsParallel:
+    """Tests for closest_pairs_parallel function."""
+
+    def test_matches_closest_pairs(self) -> None:
+        """Merged per-tile results equal the sequential selection."""
+        positions = parse_positions(EXAMPLE_INPUT)
+        expected = closest_pairs(positions, 10)
+        assert closest_pairs_parallel(positions, 10, workers=2, tile=3) == expected
+        assert closest_pairs_parallel(positions, 10, workers=1, tile=64) == expected
+
+
+class TestGridIndex:
+    """Tests for GridIndex class."""
+
+    def test_shells(self) -> None:
+        """Shells partition the points by Chebyshev cell distance."""
+        positions = [(0, 0, 0), (5, 0, 0), (10, 10, 10), (25, 0, 3)]
+        grid = GridIndex(positions, cell=10)
+        assert sorted(grid.shell(positions[0], 0)) == [0, 1]
+        assert sorted(grid.shell(positions[0], 1)) == [2]
+        assert sorted(grid.shell(positions[0], 2)) == [3]
+        assert grid.max_radius(positions[0]) == 2
+
+    def test_degenerate_axes(self) -> None:
+        """Cells are sized from the axes the points spread along."""
+        collinear = [(i * 1000, 0, 0) for i in range(100)]
+        assert GridIndex(collinear).cell == 990
+        coplanar = [(x * 100, y * 100, 5) for x in range(10) for y in range(10)]
+        assert GridIndex(coplanar).cell == 90
+
+    def test_huge_shell_scans_occupied_cells(self) -> None:
+        """Shells larger than the occupied cells are answered by a scan."""
+        positions = [(0, 0, 0), (10**9, 0, 0), (0, 10**9, 10**9)]
+        grid = GridIndex(positions, cell=1)
+        assert sorted(grid.shell(positions[0], 10**9)) == [1, 2]
+        assert list(grid.shell(positions[0], 10**9 - 1)) == []
+
+
+class TestNearestPairs:
+    """Tests for nearest_pairs function."""
+
+    def test_matches_sorted_pairs(self) -> None:
+        """Lazy pairs come out in the same distance order as a full sort."""
+        positions = parse_positions(EXAMPLE_INPUT)
+        lazy = list(nearest_pairs(positions))
+        full = list(all_pairs_by_distance(positions))
+        assert [d for d, _, _ in lazy] == [d for d, _, _ in full]
+        assert {(i, j) for _, i, j in lazy} == {(i, j) for _, i, j in full}
+
+    def test_coplanar_and_collinear(self) -> None:
+        """Flat and collinear inputs give the same order as a full sort."""
+        coplanar = [(i * 7919 % 100_003, i * 104_729 % 99_991, 0) for i in range(300)]
+        collinear = [(i * 7919 % 100_003, 0, 0) for i in range(100)]
+        for positions in (coplanar, collinear):
+            lazy = [d for d, _, _ in itertools.islice(nearest_pairs(positions), 500)]
+            full = [d for d, _, _ in all_pairs_by_distance(positions)][:500]
+            assert lazy == full
+
+    def test_duplicate_points(self) -> None:
+        """Coincident points pair at distance 0 first."""
+        pairs = list(nearest_pairs([(1, 1, 1), (9, 9, 9), (1, 1, 1)]))
+        assert pairs[0] == (0, 0, 2)
+        assert len(pairs) == 3
+
+
+class TestUnionFind:
+    """Tests for UnionFind class."""
+
+    def test_long_chain(self) -> None:
+        """Deep chains are found without hitting the recursion limit."""
+        n = 100_000
+        uf = UnionFind(n)
+        for i in range(n - 1):
+            uf.parent[i] = i + 1
+        assert uf.find(0) == n - 1
+
+    def test_union_many(self) -> None:
+        """Bulk unions report merges and keep the component count."""
+        uf = UnionFind(6)
+        assert uf.union_many([(0, 1), (1, 2), (0, 2), (3, 4)]) == 3
+        assert uf.components == 3
+        assert uf.get_component_sizes() == [3, 2, 1]
+
+    def test_largest_tracks_merges(self) -> None:
+        """The tracked largest sizes match a full scan after every union."""
+        uf = UnionFind(10, track=3)
+        for x, y in [(0, 1), (2, 3), (4, 5), (0, 2), (6, 7), (0, 4), (8, 9), (6, 8)]:
+            uf.union(x, y)
+            assert uf.largest == uf.get_component_sizes()[:3]
+        assert uf.largest == [6, 4]
+
+
 class TestConnectClosestPairs:
     """Tests for connect_closest_pairs function."""
 
@@ -88,6 +216,65 @@ class TestFindFinalConnection:
         assert {p1, p2} == expected
 
 
+class TestMinimumSpanningTree:
+    """Tests for minimum_spanning_tree function."""
+
+    def test_matches_kruskal(self) -> None:
+        """Prim's tree has the same edges as Kruskal over all sorted pairs."""
+        positions = parse_positions(EXAMPLE_INPUT)
+        uf = UnionFind(len(positions))
+        kruskal = [(d, i, j) for d, i, j in all_pairs_by_distance(positions) if uf.union(i, j)]
+        assert minimum_spanning_tree(positions) == kruskal
+
+    def test_ties_match_kruskal(self) -> None:
+        """Tied distances resolve to the same tree as Kruskal over sorted pairs."""
+        positions = [(0, 4, 1), (2, 1, 0), (4, 3, 1), (1, 3, 1), (0, 4, 0)]
+        assert find_final_connection(positions) == ((2, 1, 0), (4, 3, 1))
+        # Small lattices are full of equal distances
+        for seed in range(50):
+            positions = [(seed * k * 7 % 5, k * k % 5, (seed + k) % 2) for k in range(8)]
+            uf = UnionFind(len(positions))
+            kruskal = [(d, i, j) for d, i, j in all_pairs_by_distance(positions) if uf.union(i, j)]
+            assert minimum_spanning_tree(positions) == kruskal
+
+    def test_trivial(self) -> None:
+        """Fewer than two points have no edges."""
+        assert minimum_spanning_tree([]) == []
+        assert minimum_spanning_tree([(1, 2, 3)]) == []
+
+
+class TestCircuits:
+    """Tests for Circuits class."""
+
+    def test_example_incremental(self) -> None:
+        """Adding boxes one by one matches both parts on the example."""
+        circuits = Circuits(num_connections=10, cell=100)
+        for p in parse_positions(EXAMPLE_INPUT):
+            circuits.add_point(p)
+        assert circuits.largest_circuits() == [5, 4, 2]
+        final = circuits.final_connection()
+        assert final is not None
+        assert set(final) == {(216, 146, 977), (117, 168, 530)}
+
+    def test_matches_recompute_after_each_add(self) -> None:
+        """The final connection matches a full recompute after every addition."""
+        positions = parse_positions(EXAMPLE_INPUT)
+        circuits = Circuits(num_connections=10, cell=7)
+        for n, p in enumerate(positions, start=1):
+            circuits.add_point(p)
+            if n >= 2:
+                final = circuits.final_connection()
+                assert final is not None
+                assert set(final) == set(find_final_connection(positions[:n]))
+
+    def test_single_box(self) -> None:
+        """One box has no final connection and one circuit."""
+        circuits = Circuits()
+        circuits.add_point((1, 2, 3))
+        assert circuits.final_connection() is None
+        assert circuits.largest_circuits() == [1]
+
+
 class TestPart2:
     """Tests for part2 function."""
 
@@ -0,0 +1,54 @@
+"""Benchmarks for Day 9: Movie Theater.
+
+Run with `python -m solutions.day9.bench_day9`.
+"""
+
+import random
+import time
+
+from solutions.day9.day9 import part2, part2_parallel
+
+
+def make_polygon(num_steps: int, seed: int = 0) -> str:
+    """Generate a rectilinear skyline polygon with random step heights.
+
+    Args:
+        num_steps: Number of skyline steps (the polygon has 2 * num_steps + 2 corners)
+        seed: Random seed
+
+    Returns:
+        The polygon in puzzle input format
+    """
+    rng = random.Random(seed)
+    xs = sorted(rng.sample(range(1, 100_000), num_steps - 1))
+    xs = [0, *xs, 100_000]
+    heights: list[int] = []
+    for _ in range(num_steps):
+        height = rng.randrange(1_000, 100_000)
+        while heights and height == heights[-1]:
+            height = rng.randrange(1_000, 100_000)
+        heights.append(height)
+
+    tiles = [(0, 0), (100_000, 0)]
+    for i in reversed(range(num_steps)):
+        tiles.append((xs[i + 1], heights[i]))
+        tiles.append((xs[i], heights[i]))
+    return "\n".join(f"{x},{y}" for x, y in tiles)
+
+
+def main() -> None:
+    """Compare sequential and sharded part 2 across worker counts."""
+    data = make_polygon(250)
+
+    start = time.perf_counter()
+    expected = part2(data)
+    print(f"{'part2 (descending order)':<32} {time.perf_counter() - start:8.3f}s")
+
+    for workers in (1, 2, 4, 8, 16):
+        start = time.perf_counter()
+        assert part2_parallel(data, workers) == expected
+        print(f"{f'part2_parallel workers={workers}':<32} {time.perf_counter() - start:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
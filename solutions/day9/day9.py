@@ -1,6 +1,12 @@
 """Day 9: Movie Theater - Advent of Code 2025."""
 
-from itertools import combinations
+import os
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, islice, repeat
+from multiprocessing import Value
+from multiprocessing.sharedctypes import Synchronized
 
 from solutions.utils import get_input
 
@@ -173,6 +179,255 @@ def rectangle_valid(
     return True
 
 
+class EdgeIndex:
+    """Sorted indexes of a rectilinear polygon's edges for fast range queries.
+
+    Vertical edges are sorted by x and horizontal edges by y, so a rectangle
+    only visits the edges whose coordinate lies strictly inside its range.
+    For ray casting, the y axis is cut into bands between edge endpoints and
+    each band keeps the sorted x of the vertical edges spanning it, so a point
+    query is two bisects instead of a scan over every edge.
+    """
+
+    def __init__(self, red_tiles: list[tuple[int, int]]) -> None:
+        """Index the polygon edges.
+
+        Args:
+            red_tiles: List of red tile positions in order
+        """
+        vertical = []
+        horizontal = []
+        for (ax, ay), (bx, by) in get_polygon_edges(red_tiles):
+            if ax == bx:
+                vertical.append((ax, min(ay, by), max(ay, by)))
+            else:
+                horizontal.append((ay, min(ax, bx), max(ax, bx)))
+        self.vertical = sorted(vertical)
+        self.horizontal = sorted(horizontal)
+        self.vertical_x = [x for x, _, _ in self.vertical]
+        self.horizontal_y = [y for y, _, _ in self.horizontal]
+
+        # Band k covers y in (bands[k], bands[k + 1]]
+        self.bands = sorted({y for _, y1, y2 in self.vertical for y in (y1, y2)})
+        self.band_x: list[list[int]] = [[] for _ in range(max(len(self.bands) - 1, 0))]
+        for x, y1, y2 in self.vertical:
+            for k in range(bisect_left(self.bands, y1), bisect_left(self.bands, y2)):
+                self.band_x[k].append(x)
+        for xs in self.band_x:
+            xs.sort()
+        # Corner results are shared between the many rectangles using them
+        self._corners: dict[tuple[int, int], bool] = {}
+
+    def on_boundary(self, point: tuple[int, int]) -> bool:
+        """Check if a point lies on a polygon edge.
+
+        Args:
+            point: (x, y) point to check
+
+        Returns:
+            True if point is on an edge
+        """
+        x, y = point
+        lo = bisect_left(self.vertical_x, x)
+        hi = bisect_right(self.vertical_x, x)
+        if any(y1 <= y <= y2 for _, y1, y2 in self.vertical[lo:hi]):
+            return True
+        lo = bisect_left(self.horizontal_y, y)
+        hi = bisect_right(self.horizontal_y, y)
+        return any(x1 <= x <= x2 for _, x1, x2 in self.horizontal[lo:hi])
+
+    def crossings(self, point: tuple[int, int]) -> int:
+        """Count vertical edges crossed by a ray cast to the right of a point.
+
+        Args:
+            point: (x, y) start of the ray
+
+        Returns:
+            Number of edges with x greater than the point's and y1 < y <= y2
+        """
+        x, y = point
+        k = bisect_left(self.bands, y) - 1
+        if k < 0 or k >= len(self.band_x):
+            return 0
+        xs = self.band_x[k]
+        return len(xs) - bisect_right(xs, x)
+
+    def point_in_polygon(self, point: tuple[int, int]) -> bool:
+        """Check if a point is inside or on the boundary of the polygon.
+
+        Args:
+            point: (x, y) point to check
+
+        Returns:
+            True if point is inside or on boundary
+        """
+        return self.on_boundary(point) or self.crossings(point) % 2 == 1
+
+    def locate(self, point: tuple[int, int]) -> tuple[bool, bool]:
+        """Classify a point against the polygon.
+
+        Args:
+            point: (x, y) point to check
+
+        Returns:
+            Tuple of (inside or on boundary, on boundary)
+        """
+        if self.on_boundary(point):
+            return True, True
+        return self.crossings(point) % 2 == 1, False
+
+    def locate_many(
+        self, points: Iterable[tuple[int, int]], chunk: int = 1 << 16
+    ) -> Iterator[list[tuple[bool, bool]]]:
+        """Classify many points against the polygon in bounded chunks.
+
+        The edge indexes are built once and shared by every query, and
+        results are produced `chunk` points at a time, so arbitrarily long
+        point streams run in constant memory.
+
+        Args:
+            points: Points to classify
+            chunk: Maximum number of results per yielded list
+
+        Yields:
+            Lists of (inside or on boundary, on boundary) flags, in input order
+        """
+        locate = self.locate
+        iterator = iter(points)
+        while batch := list(islice(iterator, chunk)):
+            yield [locate(point) for point in batch]
+
+    def crosses_interior(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """Check if any polygon edge passes through a rectangle's interior.
+
+        Args:
+            x1: Left edge of the rectangle
+            y1: Top edge of the rectangle
+            x2: Right edge of the rectangle
+            y2: Bottom edge of the rectangle
+
+        Returns:
+            True if an edge strictly inside one range overlaps the other range
+        """
+        lo = bisect_right(self.vertical_x, x1)
+        hi = bisect_left(self.vertical_x, x2)
+        if any(ey1 < y2 and ey2 > y1 for _, ey1, ey2 in self.vertical[lo:hi]):
+            return True
+        lo = bisect_right(self.horizontal_y, y1)
+        hi = bisect_left(self.horizontal_y, y2)
+        return any(ex1 < x2 and ex2 > x1 for _, ex1, ex2 in self.horizontal[lo:hi])
+
+    def rectangle_valid(self, p1: tuple[int, int], p2: tuple[int, int]) -> bool:
+        """Check if rectangle with red tiles at opposite corners is valid.
+
+        Same test as rectangle_valid, answered from the indexes.
+
+        Args:
+            p1: First red corner
+            p2: Second red corner (opposite)
+
+        Returns:
+            True if rectangle is valid
+        """
+        x1, x2 = min(p1[0], p2[0]), max(p1[0], p2[0])
+        y1, y2 = min(p1[1], p2[1]), max(p1[1], p2[1])
+        for corner in ((x1, y1), (x1, y2), (x2, y1), (x2, y2)):
+            inside = self._corners.get(corner)
+            if inside is None:
+                inside = self._corners[corner] = self.point_in_polygon(corner)
+            if not inside:
+                return False
+        return not self.crosses_interior(x1, y1, x2, y2)
+
+
+class CompressedPolygon:
+    """Rectilinear polygon rasterised onto a coordinate-compressed grid.
+
+    Each red tile x (and y) gets its own grid column (row), and every
+    non-empty gap between consecutive values becomes one more, so the tiles
+    inside a compressed cell are either all inside the polygon or all outside.
+    Outside cells are found by flood fill from a padding border and summed in a
+    2-D prefix table, which validates any red-cornered rectangle in O(1).
+    """
+
+    def __init__(self, red_tiles: list[tuple[int, int]]) -> None:
+        """Rasterise the polygon and build the outside-cell prefix sums.
+
+        Args:
+            red_tiles: List of red tile positions in order
+        """
+        self.x_index = self._compress(sorted({x for x, _ in red_tiles}))
+        self.y_index = self._compress(sorted({y for _, y in red_tiles}))
+        # Leave room for one padding cell on every side
+        width = max(self.x_index.values(), default=0) + 2
+        height = max(self.y_index.values(), default=0) + 2
+
+        boundary = [[False] * width for _ in range(height)]
+        for (ax, ay), (bx, by) in get_polygon_edges(red_tiles):
+            cx1, cx2 = sorted((self.x_index[ax], self.x_index[bx]))
+            cy1, cy2 = sorted((self.y_index[ay], self.y_index[by]))
+            for cy in range(cy1, cy2 + 1):
+                for cx in range(cx1, cx2 + 1):
+                    boundary[cy][cx] = True
+
+        outside = [[False] * width for _ in range(height)]
+        outside[0][0] = True
+        stack = [(0, 0)]
+        while stack:
+            cx, cy = stack.pop()
+            for nx, ny in ((cx - 1, cy), (cx + 1, cy), (cx, cy - 1), (cx, cy + 1)):
+                if (
+                    0 <= nx < width
+                    and 0 <= ny < height
+                    and not outside[ny][nx]
+                    and not boundary[ny][nx]
+                ):
+                    outside[ny][nx] = True
+                    stack.append((nx, ny))
+
+        # prefix[cy][cx] counts outside cells in rows < cy and columns < cx
+        self.prefix = [[0] * (width + 1) for _ in range(height + 1)]
+        for cy in range(height):
+            row_total = 0
+            above, current = self.prefix[cy], self.prefix[cy + 1]
+            for cx in range(width):
+                row_total += outside[cy][cx]
+                current[cx + 1] = above[cx + 1] + row_total
+
+    @staticmethod
+    def _compress(values: list[int]) -> dict[int, int]:
+        """Map sorted coordinates to grid indices, leaving a cell for each non-empty gap."""
+        index = {}
+        cell = 1
+        for i, value in enumerate(values):
+            if i and value - values[i - 1] > 1:
+                cell += 1
+            index[value] = cell
+            cell += 1
+        return index
+
+    def rectangle_valid(self, p1: tuple[int, int], p2: tuple[int, int]) -> bool:
+        """Check if rectangle with red tiles at opposite corners is valid.
+
+        Args:
+            p1: First red corner
+            p2: Second red corner (opposite)
+
+        Returns:
+            True if no tile of the rectangle lies outside the polygon
+        """
+        cx1, cx2 = sorted((self.x_index[p1[0]], self.x_index[p2[0]]))
+        cy1, cy2 = sorted((self.y_index[p1[1]], self.y_index[p2[1]]))
+        prefix = self.prefix
+        outside = (
+            prefix[cy2 + 1][cx2 + 1]
+            - prefix[cy1][cx2 + 1]
+            - prefix[cy2 + 1][cx1]
+            + prefix[cy1][cx1]
+        )
+        return outside == 0
+
+
 def parse_tiles(data: str) -> list[tuple[int, int]]:
     """Parse red tile positions from input.
 
@@ -207,6 +462,89 @@ def rectangle_area(p1: tuple[int, int], p2: tuple[int, int]) -> int:
     return width * height
 
 
+def largest_valid_area(
+    tiles: list[tuple[int, int]], valid: Callable[[tuple[int, int], tuple[int, int]], bool]
+) -> int:
+    """Find the largest valid rectangle by checking pairs in descending area.
+
+    Areas are O(1) to compute, so all pairs are ranked first and validity is
+    only checked until the first valid rectangle, which is the largest.
+
+    Args:
+        tiles: List of red tile positions
+        valid: Validity check for a rectangle with the given opposite corners
+
+    Returns:
+        The largest valid rectangle area (0 if none is valid)
+    """
+    pairs = sorted(
+        ((rectangle_area(p1, p2), i, j) for (i, p1), (j, p2) in combinations(enumerate(tiles), 2)),
+        reverse=True,
+    )
+    for area, i, j in pairs:
+        if valid(tiles[i], tiles[j]):
+            return area
+    return 0
+
+
+def staircase(tiles: list[tuple[int, int]], sx: int, sy: int) -> list[tuple[int, int]]:
+    """Find the tiles not dominated in the direction (sx, sy).
+
+    A tile is dominated when another tile is at least as far in both the sx
+    x-direction and the sy y-direction, and the dominating tile always spans
+    a rectangle at least as large with any opposite corner.
+
+    Args:
+        tiles: List of tile positions
+        sx: 1 to prefer larger x, -1 to prefer smaller x
+        sy: 1 to prefer larger y, -1 to prefer smaller y
+
+    Returns:
+        The undominated tiles, ordered by x in the preferred direction
+    """
+    if not tiles:
+        return []
+
+    # The tile furthest along (sx, sy) dominates everything in its quadrant,
+    # which is most tiles, so only the rest need sorting
+    px, py = max(tiles, key=lambda p: sx * p[0] + sy * p[1])
+    rest = [(x, y) for x, y in tiles if sx * x > sx * px or sy * y > sy * py]
+    rest.append((px, py))
+
+    stairs = []
+    best = None
+    for x, y in sorted(rest, key=lambda p: (sx * p[0], sy * p[1]), reverse=True):
+        if best is None or sy * y > best:
+            stairs.append((x, y))
+            best = sy * y
+    return stairs
+
+
+def largest_area(tiles: list[tuple[int, int]]) -> int:
+    """Find the largest rectangle area using two tiles as opposite corners.
+
+    The largest rectangle always joins a lower-left staircase tile to an
+    upper-right one, or an upper-left to a lower-right one, so only those
+    staircases are compared pairwise. They are usually tiny compared to the
+    whole tile set.
+
+    Args:
+        tiles: List of tile positions
+
+    Returns:
+        The largest rectangle area (0 for fewer than two tiles)
+    """
+    if len(tiles) < 2:
+        return 0
+
+    max_area = 0
+    for a, b in (((-1, -1), (1, 1)), ((-1, 1), (1, -1))):
+        corners = staircase(tiles, *b)
+        for p1 in staircase(tiles, *a):
+            max_area = max(max_area, max(rectangle_area(p1, p2) for p2 in corners))
+    return max_area
+
+
 def part1(data: str) -> int:
     """Solve part 1 of the puzzle.
 
@@ -218,16 +556,76 @@ def part1(data: str) -> int:
     Returns:
         The largest rectangle area
     """
-    tiles = parse_tiles(data)
-    max_area = 0
+    return largest_area(parse_tiles(data))
+
+
+# Per-worker state for part2_parallel, set by _init_shard_worker
+_shard_tiles: list[tuple[int, int]] = []
+_shard_polygon: CompressedPolygon | None = None
+_shard_best: "Synchronized[int] | None" = None
+
+
+def _init_shard_worker(tiles: list[tuple[int, int]], best: "Synchronized[int]") -> None:
+    """Build the polygon once per worker and attach to the shared best area."""
+    global _shard_tiles, _shard_polygon, _shard_best
+    _shard_tiles = tiles
+    _shard_polygon = CompressedPolygon(tiles)
+    _shard_best = best
 
-    for p1, p2 in combinations(tiles, 2):
-        area = rectangle_area(p1, p2)
-        max_area = max(max_area, area)
 
+def _search_shard(shard: int, stride: int) -> int:
+    """Search the corner pairs whose first corner index is shard mod stride.
+
+    Pairs that cannot beat the best area found by any worker are skipped
+    without a validity check, and improvements are published back.
+
+    Args:
+        shard: Index of this shard
+        stride: Total number of shards
+
+    Returns:
+        The largest valid area found in this shard
+    """
+    assert _shard_polygon is not None and _shard_best is not None
+    tiles, valid, best = _shard_tiles, _shard_polygon.rectangle_valid, _shard_best
+    max_area = 0
+    for i in range(shard, len(tiles), stride):
+        bound = max(max_area, best.value)
+        p1 = tiles[i]
+        for p2 in tiles[i + 1 :]:
+            area = rectangle_area(p1, p2)
+            if area > bound and valid(p1, p2):
+                max_area = bound = area
+        if max_area > best.value:
+            with best.get_lock():
+                best.value = max(best.value, max_area)
     return max_area
 
 
+def part2_parallel(data: str, workers: int | None = None) -> int:
+    """Solve part 2 by sharding the corner pairs across a process pool.
+
+    Shards interleave first-corner indices so each gets a similar share of
+    pairs. Every worker builds the compressed polygon once and shares the best
+    area so far through a synchronized value to prune the others.
+
+    Args:
+        data: The puzzle input
+        workers: Number of worker processes (None for one per CPU)
+
+    Returns:
+        The largest valid rectangle area
+    """
+    tiles = parse_tiles(data)
+    workers = workers or os.cpu_count() or 1
+    stride = workers * 4
+    best: Synchronized[int] = Value("q", 0)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_shard_worker, initargs=(tiles, best)
+    ) as executor:
+        return max(executor.map(_search_shard, range(stride), repeat(stride)), default=0)
+
+
 def part2(data: str) -> int:
     """Solve part 2 of the puzzle.
 
@@ -240,15 +638,7 @@ def part2(data: str) -> int:
         The largest valid rectangle area
     """
     tiles = parse_tiles(data)
-    edges = get_polygon_edges(tiles)
-    max_area = 0
-
-    for p1, p2 in combinations(tiles, 2):
-        if rectangle_valid(p1, p2, tiles, edges):
-            area = rectangle_area(p1, p2)
-            max_area = max(max_area, area)
-
-    return max_area
+    return largest_valid_area(tiles, CompressedPolygon(tiles).rectangle_valid)
 
 
 def run() -> None:
@@ -1,6 +1,22 @@
 """Tests for Day 9: Movie Theater."""
 
-from solutions.day9.day9 import parse_tiles, part1, part2, point_in_polygon, rectangle_area
+from itertools import combinations
+
+from solutions.day9.day9 import (
+    CompressedPolygon,
+    EdgeIndex,
+    get_polygon_edges,
+    largest_area,
+    largest_valid_area,
+    parse_tiles,
+    part1,
+    part2,
+    part2_parallel,
+    point_in_polygon,
+    rectangle_area,
+    rectangle_valid,
+    staircase,
+)
 
 EXAMPLE_INPUT = """7,1
 11,1
@@ -67,6 +83,33 @@ class TestPart1:
         assert result == 50
 
 
+class TestStaircase:
+    """Tests for staircase function."""
+
+    def test_upper_right(self) -> None:
+        """Only tiles with nothing further up and right remain."""
+        tiles = [(0, 5), (1, 1), (2, 4), (3, 3), (4, 0), (1, 4)]
+        assert staircase(tiles, 1, 1) == [(4, 0), (3, 3), (2, 4), (0, 5)]
+
+    def test_empty(self) -> None:
+        """No tiles give an empty staircase."""
+        assert staircase([], -1, 1) == []
+
+
+class TestLargestArea:
+    """Tests for largest_area function."""
+
+    def test_matches_all_pairs(self) -> None:
+        """Staircase pruning finds the same maximum as every pair."""
+        tiles = [*parse_tiles(EXAMPLE_INPUT), (5, 5), (6, 2), (0, 4), (12, 3)]
+        expected = max(rectangle_area(p1, p2) for p1, p2 in combinations(tiles, 2))
+        assert largest_area(tiles) == expected
+
+    def test_too_few_tiles(self) -> None:
+        """Fewer than two tiles give no rectangle."""
+        assert largest_area([(3, 3)]) == 0
+
+
 class TestPointInPolygon:
     """Tests for point_in_polygon function."""
 
@@ -91,6 +134,99 @@ class TestPointInPolygon:
         assert not point_in_polygon((1, 1), tiles)
 
 
+def all_tiles_inside(
+    p1: tuple[int, int], p2: tuple[int, int], tiles: list[tuple[int, int]]
+) -> bool:
+    """Check every tile of a rectangle with point_in_polygon."""
+    x1, x2 = sorted((p1[0], p2[0]))
+    y1, y2 = sorted((p1[1], p2[1]))
+    return all(
+        point_in_polygon((x, y), tiles) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1)
+    )
+
+
+class TestCompressedPolygon:
+    """Tests for CompressedPolygon class."""
+
+    def test_example_matches_tile_check(self) -> None:
+        """Every corner pair agrees with checking each tile."""
+        tiles = parse_tiles(EXAMPLE_INPUT)
+        polygon = CompressedPolygon(tiles)
+        for p1, p2 in combinations(tiles, 2):
+            assert polygon.rectangle_valid(p1, p2) == all_tiles_inside(p1, p2, tiles)
+
+    def test_adjacent_edges(self) -> None:
+        """Edges one tile apart leave no gap cell for the outside to leak through."""
+        # A U shape whose notch is a single column wide
+        tiles = [(0, 0), (4, 0), (4, 5), (3, 5), (3, 1), (2, 1), (2, 5), (0, 5)]
+        polygon = CompressedPolygon(tiles)
+        for p1, p2 in combinations(tiles, 2):
+            assert polygon.rectangle_valid(p1, p2) == all_tiles_inside(p1, p2, tiles)
+
+
+class TestEdgeIndex:
+    """Tests for EdgeIndex class."""
+
+    def test_point_in_polygon_matches_scan(self) -> None:
+        """Indexed point queries agree with the edge scan around the example."""
+        tiles = parse_tiles(EXAMPLE_INPUT)
+        index = EdgeIndex(tiles)
+        for x in range(0, 14):
+            for y in range(0, 10):
+                assert index.point_in_polygon((x, y)) == point_in_polygon((x, y), tiles)
+
+    def test_rectangle_valid_matches_scan(self) -> None:
+        """Indexed rectangle checks agree with rectangle_valid."""
+        tiles = parse_tiles(EXAMPLE_INPUT)
+        index = EdgeIndex(tiles)
+        edges = get_polygon_edges(tiles)
+        for p1, p2 in combinations(tiles, 2):
+            assert index.rectangle_valid(p1, p2) == rectangle_valid(p1, p2, tiles, edges)
+
+    def test_locate_many(self) -> None:
+        """Batch classification matches single queries across chunk boundaries."""
+        tiles = parse_tiles(EXAMPLE_INPUT)
+        index = EdgeIndex(tiles)
+        points = [(x, y) for x in range(0, 14) for y in range(0, 10)]
+        flags = [flag for batch in index.locate_many(points, chunk=17) for flag in batch]
+        assert [inside for inside, _ in flags] == [point_in_polygon(p, tiles) for p in points]
+        assert flags[points.index((8, 1))] == (True, True)
+        assert flags[points.index((8, 3))] == (True, False)
+        assert flags[points.index((0, 0))] == (False, False)
+
+    def test_crosses_interior(self) -> None:
+        """Only edges strictly inside the rectangle count as crossings."""
+        index = EdgeIndex(parse_tiles(EXAMPLE_INPUT))
+        assert index.crosses_interior(2, 1, 11, 7)
+        assert not index.crosses_interior(2, 3, 9, 5)
+
+
+class TestLargestValidArea:
+    """Tests for largest_valid_area function."""
+
+    def test_example_validators(self) -> None:
+        """Both validity structures find the example answer."""
+        tiles = parse_tiles(EXAMPLE_INPUT)
+        assert largest_valid_area(tiles, CompressedPolygon(tiles).rectangle_valid) == 24
+        assert largest_valid_area(tiles, EdgeIndex(tiles).rectangle_valid) == 24
+
+    def test_stops_at_first_valid(self) -> None:
+        """Smaller rectangles are never checked once a valid one is found."""
+        tiles = parse_tiles(EXAMPLE_INPUT)
+        checked = []
+
+        def valid(p1: tuple[int, int], p2: tuple[int, int]) -> bool:
+            checked.append(rectangle_area(p1, p2))
+            return True
+
+        assert largest_valid_area(tiles, valid) == 50
+        assert checked == [50]
+
+    def test_none_valid(self) -> None:
+        """No valid rectangle gives 0."""
+        assert largest_valid_area(parse_tiles(EXAMPLE_INPUT), lambda p1, p2: False) == 0
+
+
 class TestPart2:
     """Tests for part2 function."""
 
@@ -98,3 +234,8 @@ class TestPart2:
         """Test part 2 with example input."""
         result = part2(EXAMPLE_INPUT)
         assert result == 24
+
+    def test_parallel(self) -> None:
+        """Sharded search across processes gives the same answer."""
+        assert part2_parallel(EXAMPLE_INPUT, workers=1) == 24
+        assert part2_parallel(EXAMPLE_INPUT, workers=2) == 24